@@ -0,0 +1,111 @@
+"""작성자 배지 판별 - 요청 단위로 상위 랭커 정보를 한 번만 불러와 재사용
+
+목록/상세 페이지는 작성자마다 get_badge_class()를 호출하므로
+요청 동안은 BadgeResolver가 상위 3명 순위를 메모리에서 바로 답함
+(BadgeResolverMiddleware가 요청 시작 시 생성, 종료 시 해제)
+
+렌더링된 배지 HTML은 (사용자, 언어, 형태, 순위, 배지 버전)별로 캐시
+- 배지 버전: 배지에 보이는 필드가 저장되면 변경 (CustomUser.save)
+- 순위(1~3위)가 키에 포함되므로 상위 3명이 바뀌면 자연히 새 키 사용
+"""
+import contextvars
+
+from django.core.cache import cache
+from django.template.loader import render_to_string
+from django.utils.safestring import mark_safe
+from django.utils.translation import get_language
+
+from apps.core.cache_utils import get_version, bump_version
+
+# 배지 표시에 영향을 주는 사용자 필드 (저장 시 배지 버전 변경)
+BADGE_FIELDS = frozenset([
+    'nickname', 'profile_emoji', 'special_title', 'selected_title',
+    'badge_style', 'nickname_color', 'title_color', 'nickname_bg_color',
+])
+
+BADGE_CACHE_TIMEOUT = 60 * 60 * 24
+
+_current_resolver = contextvars.ContextVar('badge_resolver', default=None)
+
+
+class BadgeResolver:
+    """요청 1건 동안 유지되는 상위 3명 순위 정보"""
+
+    TOP_LIMIT = 3
+
+    def __init__(self):
+        self._positions = None
+        self.fragments = {}  # (user_id, link, 언어) → 렌더링된 배지 HTML
+
+    def ranking_position(self, user_id):
+        """상위 3명이면 순위(1~3), 아니면 None"""
+        if self._positions is None:
+            self._positions = load_top_positions(self.TOP_LIMIT)
+        return self._positions.get(user_id)
+
+
+def load_top_positions(limit=3):
+    """전체(ALL) 랭킹 상위 limit명의 {user_id: 순위}"""
+    from apps.rankings.models import Ranking
+    from apps.rankings.leaderboard import get_leaderboard
+
+    user_ids = get_leaderboard(Ranking.PeriodType.ALL).top_user_ids(limit)
+    return {user_id: position for position, user_id in enumerate(user_ids, 1)}
+
+
+def get_badge_resolver():
+    """현재 요청의 BadgeResolver (요청 밖이면 None)"""
+    return _current_resolver.get()
+
+
+def activate_badge_resolver():
+    """새 BadgeResolver를 활성화하고 해제용 토큰 반환"""
+    return _current_resolver.set(BadgeResolver())
+
+
+def deactivate_badge_resolver(token):
+    _current_resolver.reset(token)
+
+
+def _badge_version_key(user_id):
+    return f'accounts:badge:version:{user_id}'
+
+
+def bump_badge_version(user_id):
+    """사용자 배지 캐시 무효화"""
+    bump_version(_badge_version_key(user_id))
+
+
+def render_author_badge(user, link=False):
+    """
+    작성자 배지 HTML (accounts/_author_badge.html)
+    - link=True: 프로필 링크 형태 (댓글), False: 카드용 span (작성자 없으면 '익명')
+    - 같은 요청에서 같은 작성자는 한 번만 처리
+    """
+    language = (get_language() or 'ko')[:2]
+    user_id = user.pk if user else None
+    local_key = (user_id, link, language)
+
+    resolver = get_badge_resolver()
+    if resolver is not None and local_key in resolver.fragments:
+        return resolver.fragments[local_key]
+
+    if user is None:
+        html = render_to_string('accounts/_author_badge.html', {'badge_user': None, 'link': link})
+    else:
+        position = user.get_ranking_position() or 0
+        version = get_version(_badge_version_key(user_id))
+        cache_key = f'accounts:badge:{user_id}:{language}:{int(link)}:{position}:{version}'
+        html = cache.get(cache_key)
+        if html is None:
+            html = render_to_string('accounts/_author_badge.html', {
+                'badge_user': user,
+                'badge_class': user.get_badge_class(),
+                'link': link,
+            })
+            cache.set(cache_key, str(html), BADGE_CACHE_TIMEOUT)
+
+    html = mark_safe(html)
+    if resolver is not None:
+        resolver.fragments[local_key] = html
+    return html
@@ -0,0 +1,183 @@
+"""오프라인 IP → 국가 조회 (IPLanguageMiddleware용)
+
+- update_geoip 명령어가 국가별 IP 대역 CSV(시작 IP, 끝 IP, 국가 코드)를 받아 압축 파일로 저장
+- 파일 구조: 대역 시작 주소의 정렬 배열 + 대역별 국가 번호 배열 (대역 사이 빈 구간은 국가 없음)
+  IPv4는 32비트, IPv6는 상위 64비트로 저장 (국가 단위 대역은 /64보다 잘게 나뉘지 않음)
+- 조회는 bisect 1번 (프로세스 메모리, 외부 요청 없음)
+- 파일이 갱신되면 RELOAD_INTERVAL초 안에 각 워커가 다시 읽음
+"""
+import ipaddress
+import logging
+import os
+import struct
+import sys
+import threading
+import time
+from array import array
+from bisect import bisect_right
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b'PDGEO2'
+HEADER = struct.Struct('<HII')  # 국가 수, IPv4 대역 수, IPv6 대역 수
+RELOAD_INTERVAL = 60
+
+_database = None
+_checked_at = None
+_lock = threading.Lock()
+
+
+def _to_little_endian(arr):
+    if sys.byteorder == 'big':
+        arr = array(arr.typecode, arr)
+        arr.byteswap()
+    return arr
+
+
+class GeoIPDatabase:
+    """IP 대역 → 국가 조회 테이블"""
+
+    def __init__(self, countries, starts4, codes4, starts6, codes6):
+        self.countries = countries   # 국가 번호 → 국가 코드 (0번은 국가 없음)
+        self.starts4 = starts4       # array('I') IPv4 대역 시작 주소
+        self.codes4 = codes4         # array('H') 대역별 국가 번호
+        self.starts6 = starts6       # array('Q') IPv6 대역 시작 주소 상위 64비트
+        self.codes6 = codes6
+
+    def lookup(self, ip):
+        """국가 코드 (모르면 None)"""
+        try:
+            address = ipaddress.ip_address(ip)
+        except ValueError:
+            return None
+
+        if address.version == 6 and address.ipv4_mapped:
+            address = address.ipv4_mapped
+        if address.version == 4:
+            starts, codes, key = self.starts4, self.codes4, int(address)
+        else:
+            starts, codes, key = self.starts6, self.codes6, int(address) >> 64
+
+        index = bisect_right(starts, key) - 1
+        if index < 0:
+            return None
+        return self.countries[codes[index]] or None
+
+    @classmethod
+    def build(cls, ranges):
+        """
+        (시작 IP, 끝 IP, 국가 코드) 목록으로 생성
+        - 인접한 같은 국가 대역은 합치고, 대역 사이 빈 구간은 국가 없음으로 채움
+        """
+        countries = ['']
+        country_index = {'': 0}
+        tables = {4: ([], []), 6: ([], [])}
+        max_key = {4: 2 ** 32 - 1, 6: 2 ** 64 - 1}
+
+        parsed = {4: [], 6: []}
+        for start, end, country in ranges:
+            start, end = ipaddress.ip_address(start), ipaddress.ip_address(end)
+            if start.version != end.version:
+                continue
+            shift = 0 if start.version == 4 else 64
+            parsed[start.version].append((int(start) >> shift, int(end) >> shift, country.upper()))
+
+        for version, rows in parsed.items():
+            starts, codes = tables[version]
+            next_start = 0
+            for start, end, country in sorted(rows):
+                if end < next_start:
+                    continue
+                start = max(start, next_start)
+                if start > next_start:
+                    # 빈 구간
+                    starts.append(next_start)
+                    codes.append(0)
+                if country not in country_index:
+                    country_index[country] = len(countries)
+                    countries.append(country)
+                code = country_index[country]
+                # 바로 앞 대역과 같은 국가면 합침
+                if not (codes and codes[-1] == code and start == next_start):
+                    starts.append(start)
+                    codes.append(code)
+                next_start = end + 1
+            if starts and next_start <= max_key[version]:
+                starts.append(next_start)
+                codes.append(0)
+
+        return cls(
+            countries,
+            array('I', tables[4][0]), array('H', tables[4][1]),
+            array('Q', tables[6][0]), array('H', tables[6][1]),
+        )
+
+    def save(self, path):
+        """파일로 저장 (임시 파일에 쓴 뒤 교체 - 읽는 중인 워커에 영향 없음)"""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(MAGIC)
+            f.write(HEADER.pack(len(self.countries), len(self.starts4), len(self.starts6)))
+            f.write(''.join(country.ljust(2) for country in self.countries).encode('ascii'))
+            for arr in (self.starts4, self.codes4, self.starts6, self.codes6):
+                _to_little_endian(arr).tofile(f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f'{path}: GeoIP 파일 형식이 아닙니다')
+            num_countries, n4, n6 = HEADER.unpack(f.read(HEADER.size))
+            raw = f.read(num_countries * 2).decode('ascii')
+            countries = [raw[i:i + 2].strip() for i in range(0, len(raw), 2)]
+
+            arrays = []
+            for typecode, count in (('I', n4), ('H', n4), ('Q', n6), ('H', n6)):
+                arr = array(typecode)
+                arr.fromfile(f, count)
+                arrays.append(_to_little_endian(arr))
+        return cls(countries, *arrays)
+
+    def __len__(self):
+        return len(self.starts4) + len(self.starts6)
+
+
+def get_database():
+    """현재 GeoIP 데이터베이스 (파일이 없으면 None, 파일이 바뀌었으면 다시 로드)"""
+    global _database, _checked_at
+
+    now = time.monotonic()
+    if _checked_at is not None and now - _checked_at < RELOAD_INTERVAL:
+        return _database[1] if _database else None
+
+    with _lock:
+        if _checked_at is not None and now - _checked_at < RELOAD_INTERVAL:
+            return _database[1] if _database else None
+        _checked_at = now
+
+        path = settings.GEOIP_DB_PATH
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            if _database is None:
+                logger.warning(f"GeoIP database not found: {path} (python manage.py update_geoip)")
+            return _database[1] if _database else None
+
+        if _database is None or _database[0] != mtime:
+            try:
+                _database = (mtime, GeoIPDatabase.load(path))
+            except (OSError, ValueError, EOFError) as e:
+                logger.error(f"GeoIP database load failed: {e}")
+        return _database[1] if _database else None
+
+
+def country_for_ip(ip):
+    """IP의 국가 코드 (데이터베이스가 없거나 모르는 IP면 None)"""
+    database = get_database()
+    if database is None:
+        return None
+    return database.lookup(ip)
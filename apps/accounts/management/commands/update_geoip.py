@@ -0,0 +1,66 @@
+"""GeoIP 데이터베이스 갱신 관리 명령어 - 국가별 IP 대역 CSV를 받아 조회용 파일로 변환
+
+CSV 형식: 시작 IP,끝 IP,국가 코드 (IPv4/IPv6, .gz 가능)
+기본 원본: settings.GEOIP_SOURCES (DB-IP Lite Country, CC BY 4.0)
+
+사용법 (매월 cron 실행 권장):
+    python manage.py update_geoip
+    python manage.py update_geoip --source /path/to/ipv4.csv --source /path/to/ipv6.csv.gz
+"""
+import csv
+import gzip
+import io
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.accounts.geoip import GeoIPDatabase
+from apps.core.http import get_upstream
+
+
+class Command(BaseCommand):
+    help = 'IP → 국가 조회용 GeoIP 데이터베이스 파일을 갱신합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--source',
+            action='append',
+            help='CSV URL 또는 파일 경로 (여러 번 지정 가능, 기본: settings.GEOIP_SOURCES)',
+        )
+
+    def handle(self, *args, **options):
+        sources = options['source'] or settings.GEOIP_SOURCES
+        started = time.monotonic()
+
+        ranges = []
+        for source in sources:
+            self.stdout.write(f"읽는 중: {source}")
+            ranges.extend(self._read_ranges(source))
+        if not ranges:
+            raise CommandError('IP 대역을 하나도 읽지 못했습니다.')
+
+        database = GeoIPDatabase.build(ranges)
+        database.save(settings.GEOIP_DB_PATH)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"\n완료: 원본 {len(ranges)}개 → 대역 {len(database)}개, 국가 {len(database.countries) - 1}개 "
+            f"({settings.GEOIP_DB_PATH}, {time.monotonic() - started:.1f}초)"
+        ))
+
+    def _read_ranges(self, source):
+        if source.startswith(('http://', 'https://')):
+            response = get_upstream('geoip').get(source)
+            if not response.ok:
+                raise CommandError(f'{source}: HTTP {response.status_code}')
+            data = response.content
+        else:
+            with open(source, 'rb') as f:
+                data = f.read()
+
+        if data[:2] == b'\x1f\x8b':
+            data = gzip.decompress(data)
+
+        for row in csv.reader(io.StringIO(data.decode('utf-8'))):
+            if len(row) >= 3 and len(row[2]) == 2 and row[2].isalpha():
+                yield row[0], row[1], row[2]
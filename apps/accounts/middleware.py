@@ -1,13 +1,14 @@
 """사용자/IP 차단 + IP 기반 언어 감지 미들웨어"""
 import logging
-import urllib.request
-import json
+import re
 
 from django.conf import settings
 from django.http import HttpResponseForbidden
 from django.template.loader import render_to_string
 from django.utils import translation
 
+from .badges import activate_badge_resolver, deactivate_badge_resolver
+from .geoip import country_for_ip
 from .models import UserBan
 
 logger = logging.getLogger(__name__)
@@ -18,12 +19,28 @@ COUNTRY_LANGUAGE_MAP = {
     'JP': 'ja',
 }
 
+# 검색엔진/링크 미리보기/모니터링 봇 User-Agent (언어 감지 생략)
+BOT_USER_AGENT_RE = re.compile(
+    r'bot|crawl|spider|slurp|archiver|facebookexternalhit|embedly|preview|'
+    r'curl|wget|python-requests|httpclient|go-http-client|okhttp|headless|lighthouse|monitor',
+    re.IGNORECASE,
+)
+
+
+def is_bot_request(request):
+    """크롤러/스크립트 요청 여부 (User-Agent 기준, 비어 있으면 봇으로 간주)"""
+    user_agent = request.META.get('HTTP_USER_AGENT', '')
+    return not user_agent or bool(BOT_USER_AGENT_RE.search(user_agent))
+
 
 class IPLanguageMiddleware:
     """
     첫 방문 시 IP로 국가를 판별하여 언어를 자동 설정하는 미들웨어.
     - django_language 쿠키가 없을 때만 동작 (수동 선택 우선)
-    - 세션에 결과를 캐시하여 API 호출 최소화
+    - 국가 판별은 로컬 GeoIP 데이터베이스 조회 (외부 요청 없음, update_geoip 명령어로 갱신)
+    - 데이터베이스가 없거나 국가를 모르는 IP면 판별하지 않음 (쿠키 없이 LocaleMiddleware 기본 동작)
+    - 결과는 언어 쿠키로만 저장 (세션을 만들지 않음)
+    - 봇은 판별하지 않고 기본 언어 그대로
     - LocaleMiddleware 앞에 배치
     """
 
@@ -37,30 +54,31 @@ class IPLanguageMiddleware:
         if any(request.path.startswith(p) for p in self.SKIP_PATHS):
             return self.get_response(request)
 
-        # 이미 사용자가 수동으로 언어를 선택했으면 스킵
+        # 이미 언어 쿠키가 있으면 (수동 선택 또는 이전 감지 결과) 스킵
         if request.COOKIES.get(settings.LANGUAGE_COOKIE_NAME):
             return self.get_response(request)
 
-        # 세션에 이미 감지된 언어가 있으면 사용
-        detected_lang = request.session.get('ip_detected_lang')
+        # 크롤러는 국가 판별/쿠키 없이 기본 언어
+        if is_bot_request(request):
+            return self.get_response(request)
 
-        if not detected_lang:
-            # IP로 국가 판별
-            ip = self._get_client_ip(request)
-            if ip:
-                country = self._get_country_from_ip(ip)
-                detected_lang = COUNTRY_LANGUAGE_MAP.get(country, 'en')
-                request.session['ip_detected_lang'] = detected_lang
+        # IP로 국가 판별
+        detected_lang = None
+        ip = self._get_client_ip(request)
+        country = self._get_country_from_ip(ip) if ip else None
+        if country:
+            detected_lang = COUNTRY_LANGUAGE_MAP.get(country, 'en')
 
         if detected_lang:
-            # Django의 언어 활성화
+            # Django의 언어 활성화 + 이번 요청의 LocaleMiddleware도 같은 언어를 사용하도록 쿠키 값 주입
             translation.activate(detected_lang)
             request.LANGUAGE_CODE = detected_lang
+            request.COOKIES[settings.LANGUAGE_COOKIE_NAME] = detected_lang
 
         response = self.get_response(request)
 
         # 응답에 언어 쿠키 설정 (다음 요청부터 LocaleMiddleware가 처리)
-        if detected_lang and not request.COOKIES.get(settings.LANGUAGE_COOKIE_NAME):
+        if detected_lang:
             response.set_cookie(
                 settings.LANGUAGE_COOKIE_NAME,
                 detected_lang,
@@ -78,22 +96,12 @@ class IPLanguageMiddleware:
         return request.META.get('REMOTE_ADDR')
 
     def _get_country_from_ip(self, ip):
-        """ipapi.co API로 국가 코드 조회 (무료, 30k/월)"""
+        """로컬 GeoIP 데이터베이스로 국가 코드 조회"""
         # 로컬 IP는 한국으로 간주
         if ip in ('127.0.0.1', '::1', 'localhost') or ip.startswith('192.168.') or ip.startswith('10.'):
             return 'KR'
 
-        try:
-            url = f'https://ipapi.co/{ip}/country/'
-            req = urllib.request.Request(url, headers={'User-Agent': 'PikminDiary/1.0'})
-            with urllib.request.urlopen(req, timeout=3) as resp:
-                country = resp.read().decode('utf-8').strip()
-                if len(country) == 2 and country.isalpha():
-                    return country.upper()
-        except Exception as e:
-            logger.warning(f'IP geolocation failed for {ip}: {e}')
-
-        return None
+        return country_for_ip(ip)
 
 
 class BanCheckMiddleware:
@@ -110,16 +118,19 @@ class BanCheckMiddleware:
         if any(request.path.startswith(p) for p in self.EXEMPT_PATHS):
             return self.get_response(request)
 
+        # 활성 정지 스냅샷 (요청당 버전 확인 1번, 이후 dict 조회만)
+        bans = UserBan.get_active_bans()
+
         # IP 차단 확인
         ip = self._get_client_ip(request)
-        if ip and UserBan.is_ip_banned(ip):
+        if ip and UserBan.is_ip_banned(ip, bans):
             return HttpResponseForbidden(
                 '<h1>접근이 제한되었습니다</h1>'
                 '<p>이용이 정지된 상태입니다. 문의사항은 관리자에게 연락해주세요.</p>'
             )
 
         # 로그인 사용자 차단 확인
-        if request.user.is_authenticated and UserBan.is_user_banned(request.user):
+        if request.user.is_authenticated and UserBan.is_user_banned(request.user, bans):
             return HttpResponseForbidden(
                 '<h1>접근이 제한되었습니다</h1>'
                 '<p>이용이 정지된 상태입니다. 문의사항은 관리자에게 연락해주세요.</p>'
@@ -132,3 +143,17 @@ class BanCheckMiddleware:
         if x_forwarded_for:
             return x_forwarded_for.split(',')[0].strip()
         return request.META.get('REMOTE_ADDR')
+
+
+class BadgeResolverMiddleware:
+    """요청마다 작성자 배지 판별용 BadgeResolver를 활성화하는 미들웨어"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        token = activate_badge_resolver()
+        try:
+            return self.get_response(request)
+        finally:
+            deactivate_badge_resolver(token)
@@ -1,7 +1,23 @@
+import time
+
 from django.contrib.auth.models import AbstractUser
-from django.db import models
+from django.db import models, transaction
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
+from apps.core.cache_utils import get_version, bump_version
+
+# 활성 정지 목록 프로세스 내 스냅샷 (정지/해제/삭제 시 버전 토큰이 바뀌면 다시 조회)
+BAN_SNAPSHOT_VERSION_KEY = 'accounts:bans:version'
+BAN_SNAPSHOT_MAX_AGE = 300  # 버전이 그대로여도 이 시간(초)이 지나면 다시 조회 (queryset.update 등 대비)
+# (버전, 조회 시각, {'ips': ..., 'users': ...}) - 새 튜플로 한 번에 교체 (읽는 쪽이 버전과 목록이 어긋난 상태를 보지 않도록)
+_ban_snapshot = (None, 0.0, None)
+
+
+def bump_ban_snapshot_version():
+    """커밋 후 정지 목록 버전 변경 → 모든 워커가 다음 요청에서 다시 조회"""
+    transaction.on_commit(lambda: bump_version(BAN_SNAPSHOT_VERSION_KEY))
+
 
 class CustomUser(AbstractUser):
     """
@@ -173,18 +189,22 @@ class CustomUser(AbstractUser):
             self.nickname = self.username or f'user_{self.pk}'
         super().save(*args, **kwargs)
 
+        # 배지에 보이는 필드가 바뀌었을 수 있으면 배지 캐시 무효화
+        from .badges import BADGE_FIELDS, bump_badge_version
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or BADGE_FIELDS.intersection(update_fields):
+            user_id = self.pk
+            transaction.on_commit(lambda: bump_badge_version(user_id))
+
     def get_ranking_position(self):
         """현재 사용자의 랭킹 순위 반환 (1, 2, 3 또는 None)"""
+        from .badges import get_badge_resolver, load_top_positions
         try:
-            from apps.rankings.models import Ranking
-            # 전체 기간(ALL) 랭킹에서 상위 3명 조회
-            top_3_rankings = Ranking.objects.filter(
-                period_type=Ranking.PeriodType.ALL
-            ).order_by('-score')[:3]
-
-            for idx, ranking in enumerate(top_3_rankings, 1):
-                if ranking.user_id == self.id:
-                    return idx
+            # 요청 중에는 요청 단위로 한 번 불러온 상위 3명 정보 사용
+            resolver = get_badge_resolver()
+            if resolver is not None:
+                return resolver.ranking_position(self.id)
+            return load_top_positions(3).get(self.id)
         except Exception:
             pass
         return None
@@ -308,10 +328,8 @@ class CustomUser(AbstractUser):
         """랭킹에 등록되어 있는지 확인"""
         try:
             from apps.rankings.models import Ranking
-            return Ranking.objects.filter(
-                user=self,
-                period_type=Ranking.PeriodType.ALL
-            ).exists()
+            from apps.rankings.leaderboard import get_leaderboard
+            return get_leaderboard(Ranking.PeriodType.ALL).rank_of(self.id) is not None
         except Exception:
             return False
 
@@ -405,6 +423,7 @@ class UserBan(models.Model):
                 self.expires_at = timezone.now() + duration_map[self.duration]
         
         super().save(*args, **kwargs)
+        bump_ban_snapshot_version()
     
     @property
     def is_expired(self):
@@ -417,23 +436,51 @@ class UserBan(models.Model):
         return False
     
     @classmethod
-    def is_user_banned(cls, user):
-        """사용자가 정지되었는지 확인"""
-        from django.utils import timezone
-        return cls.objects.filter(
-            user=user,
-            is_active=True
-        ).filter(
+    def get_active_bans(cls):
+        """
+        활성 정지 스냅샷 {'ips': {IP: 만료 시각}, 'users': {사용자 ID: 만료 시각}} (영구 정지는 None)
+        - 정지/해제/삭제 시 버전이 바뀌면 다시 조회, 만료된 항목은 조회 시점에 판단
+        """
+        global _ban_snapshot
+
+        version = get_version(BAN_SNAPSHOT_VERSION_KEY)
+        now = time.monotonic()
+        snapshot_version, loaded_at, bans = _ban_snapshot
+        if snapshot_version == version and now - loaded_at < BAN_SNAPSHOT_MAX_AGE:
+            return bans
+
+        ips, users = {}, {}
+        rows = cls.objects.filter(is_active=True).filter(
             models.Q(duration='perm') | models.Q(expires_at__gt=timezone.now())
-        ).exists()
+        ).values_list('user_id', 'ip_address', 'duration', 'expires_at')
+        for user_id, ip_address, duration, expires_at in rows:
+            expires = None if duration == cls.BanDuration.PERMANENT else expires_at
+            for targets, key in ((users, user_id), (ips, ip_address)):
+                if key is None:
+                    continue
+                # 같은 대상의 정지가 여러 개면 가장 늦게 끝나는 것 기준
+                if key not in targets or (targets[key] is not None and (expires is None or expires > targets[key])):
+                    targets[key] = expires
+
+        bans = {'ips': ips, 'users': users}
+        _ban_snapshot = (version, now, bans)
+        return bans
+
+    @staticmethod
+    def _is_banned(targets, key):
+        if key not in targets:
+            return False
+        expires = targets[key]
+        return expires is None or expires > timezone.now()
+
+    @classmethod
+    def is_user_banned(cls, user, bans=None):
+        """사용자가 정지되었는지 확인 (스냅샷 조회, 쿼리 없음)"""
+        bans = bans or cls.get_active_bans()
+        return cls._is_banned(bans['users'], user.pk)
     
     @classmethod
-    def is_ip_banned(cls, ip_address):
-        """IP가 정지되었는지 확인"""
-        from django.utils import timezone
-        return cls.objects.filter(
-            ip_address=ip_address,
-            is_active=True
-        ).filter(
-            models.Q(duration='perm') | models.Q(expires_at__gt=timezone.now())
-        ).exists()
+    def is_ip_banned(cls, ip_address, bans=None):
+        """IP가 정지되었는지 확인 (스냅샷 조회, 쿼리 없음)"""
+        bans = bans or cls.get_active_bans()
+        return cls._is_banned(bans['ips'], ip_address)
@@ -0,0 +1,14 @@
+"""Signals for accounts app"""
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from .models import UserBan, bump_ban_snapshot_version
+
+
+@receiver(post_delete, sender=UserBan)
+def invalidate_ban_snapshot(sender, instance, **kwargs):
+    """
+    정지 삭제 시 정지 목록 스냅샷 무효화
+    - 관리자 일괄 삭제(queryset.delete), 사용자 삭제로 함께 지워지는 경우 포함
+    """
+    bump_ban_snapshot_version()
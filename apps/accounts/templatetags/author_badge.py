@@ -0,0 +1,14 @@
+from django import template
+
+from apps.accounts.badges import render_author_badge
+
+register = template.Library()
+
+
+@register.simple_tag
+def author_badge(user, link=False):
+    """
+    작성자 배지 (캐시된 HTML)
+    사용법: {% author_badge coord.author %}, {% author_badge comment.author link=True %}
+    """
+    return render_author_badge(user, link=link)
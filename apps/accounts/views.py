@@ -2,12 +2,15 @@
 from django.shortcuts import render, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.core.paginator import Paginator
+from django.conf import settings
+from django.contrib import messages
 
 from .models import CustomUser
 from apps.coordinates.models import Coordinate
 from apps.interactions.models import Bookmark
 from apps.core.models import Suggestion
 from apps.comments.models import Comment
+from apps.core.uploads import process_image_upload, ImageUploadError
 
 
 @login_required
@@ -97,7 +100,13 @@ def my_settings(request):
         user.bio = request.POST.get('bio', user.bio)
 
         if 'profile_image' in request.FILES:
-            user.profile_image = request.FILES['profile_image']
+            try:
+                user.profile_image = process_image_upload(
+                    request.FILES['profile_image'],
+                    max_dimension=settings.PROFILE_IMAGE_MAX_DIMENSION,
+                )
+            except ImageUploadError as e:
+                messages.error(request, str(e))
 
         # 이모지 설정 (랭킹 등록 사용자만)
         if user.has_ranking():
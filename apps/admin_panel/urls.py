@@ -22,4 +22,9 @@ urlpatterns = [
     path('batch/ban/', views.ban_user, name='ban_user'),
     path('bans/', views.ban_list, name='ban_list'),
     path('bans/<int:pk>/unban/', views.unban_user, name='unban_user'),
+
+    # 운영 지표
+    path('ops/outbound/', views.outbound_status, name='outbound_status'),
+    path('ops/translation-cache/', views.translation_cache_status, name='translation_cache_status'),
+    path('ops/translation-usage/', views.translation_usage, name='translation_usage'),
 ]
@@ -4,12 +4,14 @@ from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib import messages
 from django.utils import timezone
 from django.core.paginator import Paginator
-from django.http import HttpResponseForbidden
+from django.http import HttpResponseForbidden, JsonResponse
 
 from apps.coordinates.models import Coordinate
 from apps.reports.models import Report
 from apps.accounts.models import CustomUser
-from apps.rankings.utils import update_user_ranking
+from apps.rankings.utils import apply_ranking_delta
+from apps.core.http import upstream_status
+from apps.translations import budget as translation_budget, lookup_cache
 
 
 @staff_member_required
@@ -60,20 +62,19 @@ def approve_coordinate(request, pk):
     coordinate = get_object_or_404(Coordinate, pk=pk)
     
     if request.method == 'POST':
+        was_approved = coordinate.status == Coordinate.Status.APPROVED
         coordinate.status = Coordinate.Status.APPROVED
         coordinate.approved_at = timezone.now()
         coordinate.save()
         
-        # 작성자 통계 및 랭킹 업데이트
-        if coordinate.author:
-            coordinate.author.total_posts = Coordinate.objects.filter(
-                author=coordinate.author,
-                status=Coordinate.Status.APPROVED
-            ).count()
-            coordinate.author.save(update_fields=['total_posts'])
-            
-            # 랭킹 업데이트
-            update_user_ranking(coordinate.author)
+        # 작성자 통계 및 랭킹 반영 (새로 승인된 경우만 - 승인 전 복사 수 포함)
+        if coordinate.author and not was_approved:
+            apply_ranking_delta(
+                coordinate.author,
+                occurred_at=coordinate.approved_at,
+                posts=1,
+                copies=coordinate.copy_count,
+            )
         
         messages.success(request, f'"{coordinate.title}"이(가) 승인되었습니다.')
     
@@ -350,3 +351,26 @@ def unban_user(request, pk):
         messages.success(request, f'{target}의 정지가 해제되었습니다.')
     
     return redirect('admin_panel:ban_list')
+
+
+@staff_member_required
+def outbound_status(request):
+    """외부 API(DeepL, Nominatim, GeoIP 데이터베이스 다운로드) 연결 상태/지표 (현재 워커 프로세스 기준)"""
+    return JsonResponse(upstream_status())
+
+
+@staff_member_required
+def translation_cache_status(request):
+    """번역 조회 캐시 적중/미스 수 (현재 워커 프로세스 기준)"""
+    return JsonResponse(lookup_cache.stats())
+
+
+@staff_member_required
+def translation_usage(request):
+    """DeepL 글자 수 사용량/예산 + 우선순위별 보류 작업 수"""
+    usage = translation_budget.get_usage()
+    return JsonResponse({
+        **usage,
+        'allowed_priority': translation_budget.allowed_priority(usage),
+        'queued_jobs': translation_budget.queue_status(),
+    })
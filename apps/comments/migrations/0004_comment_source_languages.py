@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-19 11:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('comments', '0003_comment_photo_alter_comment_content'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='comment',
+            name='source_languages',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
@@ -1,13 +1,15 @@
 from django.db import models
 from django.conf import settings
 from django.utils.translation import gettext_lazy as _
-from PIL import Image
-import os
 
+from apps.translations.models import TranslatableModel
 
-class Comment(models.Model):
+
+class Comment(TranslatableModel):
     """댓글 (대댓글 지원)"""
 
+    translatable_fields = ('content',)
+
     coordinate = models.ForeignKey(
         'coordinates.Coordinate',
         on_delete=models.CASCADE,
@@ -104,17 +106,3 @@ class Comment(models.Model):
     def like_count(self):
         """댓글 좋아요 수"""
         return self.likes.count()
-
-    def save(self, *args, **kwargs):
-        """저장 시 이미지 리사이징"""
-        super().save(*args, **kwargs)
-
-        if self.photo:
-            img_path = self.photo.path
-            img = Image.open(img_path)
-
-            # 최대 크기 제한 (1920px)
-            max_size = (1920, 1920)
-            if img.height > max_size[0] or img.width > max_size[1]:
-                img.thumbnail(max_size, Image.Lanczos)
-                img.save(img_path, optimize=True, quality=85)
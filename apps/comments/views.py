@@ -9,20 +9,19 @@ from django.contrib.auth.hashers import make_password, check_password
 from .models import Comment
 from apps.coordinates.models import Coordinate
 from apps.interactions.models import Notification
+from apps.core.uploads import process_image_upload, ImageUploadError
 
 
 # ===== 헬퍼 함수 =====
 
-def _validate_photo(photo):
-    """사진 파일 검증. 오류 시 메시지 문자열 반환, 정상이면 None"""
+def _process_photo(photo):
+    """사진 파일 검증 + 정규화. (처리된 파일, 오류 메시지) 튜플 반환"""
     if not photo:
-        return None
-    if photo.size > 5 * 1024 * 1024:
-        return _('사진 파일 크기는 5MB를 초과할 수 없습니다.')
-    allowed_types = ['image/jpeg', 'image/png', 'image/webp']
-    if photo.content_type not in allowed_types:
-        return _('허용되지 않는 파일 형식입니다. (JPG, PNG, WEBP만 가능)')
-    return None
+        return None, None
+    try:
+        return process_image_upload(photo), None
+    except ImageUploadError as e:
+        return None, str(e)
 
 
 def _create_comment(request, content, photo=None, parent=None, coordinate=None, farming_journal=None):
@@ -77,7 +76,7 @@ def comment_create(request, coordinate_id):
         messages.error(request, _('댓글 내용이나 사진 중 하나는 입력해주세요.'))
         return redirect('coordinates:detail', pk=coordinate_id)
 
-    photo_error = _validate_photo(photo)
+    photo, photo_error = _process_photo(photo)
     if photo_error:
         messages.error(request, photo_error)
         return redirect('coordinates:detail', pk=coordinate_id)
@@ -205,7 +204,7 @@ def comment_reply(request, pk):
         messages.error(request, _('댓글 내용이나 사진 중 하나는 입력해주세요.'))
         return redirect('coordinates:detail', pk=coordinate.pk)
 
-    photo_error = _validate_photo(photo)
+    photo, photo_error = _process_photo(photo)
     if photo_error:
         messages.error(request, photo_error)
         return redirect('coordinates:detail', pk=coordinate.pk)
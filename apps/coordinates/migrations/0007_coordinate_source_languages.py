@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-19 11:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('coordinates', '0006_remove_coordinate_coordinates_valid_c_5ae324_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='coordinate',
+            name='source_languages',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
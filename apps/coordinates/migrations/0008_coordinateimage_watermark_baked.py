@@ -0,0 +1,25 @@
+# Generated by Django 6.0 on 2026-10-19 21:40
+
+from django.db import migrations, models
+
+
+def mark_baked_images(apps, schema_editor):
+    """이전 방식은 워터마크를 켜면 원본 파일에 직접 그렸으므로 해당 이미지는 원본 그대로 표시"""
+    CoordinateImage = apps.get_model('coordinates', 'CoordinateImage')
+    CoordinateImage.objects.filter(coordinate__watermark_enabled=True).update(watermark_baked=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('coordinates', '0007_coordinate_source_languages'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='coordinateimage',
+            name='watermark_baked',
+            field=models.BooleanField(default=False, editable=False, verbose_name='원본에 워터마크 적용됨'),
+        ),
+        migrations.RunPython(mark_baked_images, migrations.RunPython.noop),
+    ]
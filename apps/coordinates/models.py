@@ -3,9 +3,13 @@ from django.conf import settings
 from django.utils.translation import gettext_lazy as _
 from django.core.validators import MinValueValidator, MaxValueValidator
 
+from apps.translations.models import TranslatableModel
 
-class Coordinate(models.Model):
+
+class Coordinate(TranslatableModel):
     """좌표 게시글"""
+
+    translatable_fields = ('title', 'description', 'postcard_name')
     
     class Category(models.TextChoices):
         MUSHROOM = 'MUSHROOM', _('버섯')
@@ -150,6 +154,16 @@ class Coordinate(models.Model):
         
         return self.Region.OTHER
     
+    @property
+    def watermark_text(self):
+        """워터마크에 표시할 텍스트 (지정 이름 > 작성자 닉네임 > 사이트명)"""
+        if self.watermark_name:
+            return self.watermark_name
+        if self.author:
+            return self.author.nickname
+        from .watermark_utils import DEFAULT_WATERMARK_TEXT
+        return DEFAULT_WATERMARK_TEXT
+
     def save(self, *args, **kwargs):
         """저장 시 지역 자동 감지"""
         if not self.region or self.region == self.Region.OTHER:
@@ -171,6 +185,12 @@ class CoordinateImage(models.Model):
         upload_to='coordinates/%Y/%m/'
     )
     order = models.PositiveSmallIntegerField(_('순서'), default=0)
+    # 이전 방식으로 원본 파일에 워터마크가 이미 들어간 이미지 (파생 이미지 없이 원본 그대로 표시)
+    watermark_baked = models.BooleanField(
+        _('원본에 워터마크 적용됨'),
+        default=False,
+        editable=False,
+    )
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
@@ -181,94 +201,29 @@ class CoordinateImage(models.Model):
     def __str__(self):
         return f"{self.coordinate.title} - 이미지 {self.order + 1}"
 
-    def save(self, *args, **kwargs):
-        """저장 시 워터마크 적용"""
-        super().save(*args, **kwargs)
-
-        # 워터마크 적용
-        if self.coordinate.watermark_enabled and self.image:
-            self._apply_watermark()
-
-    def _apply_watermark(self):
-        """이미지에 워터마크 적용"""
-        from PIL import Image, ImageDraw, ImageFont
-        import os
+    @property
+    def display_url(self):
+        """
+        화면에 표시할 이미지 URL
+        - 워터마크 사용 시 (원본, 워터마크 텍스트) 조합의 파생 이미지 URL
+        - 파생 이미지가 아직 없으면 백그라운드 생성을 예약하고 원본 URL 반환 (요청 중에 이미지 처리 안 함)
+        - 원본 파일은 수정하지 않음 (이전 방식으로 워터마크가 들어간 원본은 그대로 표시)
+        """
+        from django.core.files.storage import default_storage
+        from .watermark_utils import derivative_exists, derivative_name, request_derivatives
+
+        if not self.image:
+            return ''
+        if self.watermark_baked or not self.coordinate.watermark_enabled:
+            return self.image.url
 
         try:
-            img_path = self.image.path
-            img = Image.open(img_path)
-
-            # RGBA로 변환 (투명도 지원)
-            if img.mode != 'RGBA':
-                img = img.convert('RGBA')
-
-            # 워터마크 텍스트 결정
-            watermark_text = self.coordinate.watermark_name
-            if not watermark_text:
-                if self.coordinate.author:
-                    watermark_text = self.coordinate.author.nickname
-                else:
-                    watermark_text = "피크민다이어리"
-
-            # 워터마크 레이어 생성
-            txt_layer = Image.new('RGBA', img.size, (255, 255, 255, 0))
-            draw = ImageDraw.Draw(txt_layer)
-
-            # 폰트 크기 계산 (이미지 너비의 5% - 더 굵직하게)
-            font_size = max(24, int(img.width * 0.05))
-
-            # 시스템 폰트 사용 (한글 지원 - Bold 폰트 우선)
-            try:
-                # 우분투/데비안 한글 Bold 폰트
-                font = ImageFont.truetype('/usr/share/fonts/truetype/nanum/NanumGothicBold.ttf', font_size)
-            except OSError:
-                try:
-                    # 일반 나눔고딕
-                    font = ImageFont.truetype('/usr/share/fonts/truetype/nanum/NanumGothic.ttf', font_size)
-                except OSError:
-                    try:
-                        # 대체 폰트
-                        font = ImageFont.truetype('/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf', font_size)
-                    except OSError:
-                        font = ImageFont.load_default()
-
-            # 텍스트 크기 계산
-            bbox = draw.textbbox((0, 0), watermark_text, font=font)
-            text_width = bbox[2] - bbox[0]
-            text_height = bbox[3] - bbox[1]
-
-            # 워터마크 위치 계산 (중앙 영역 대각선 배치)
-            # 이미지 중앙에서 좌상단, 우하단으로 대각선 배치
-            center_x = img.width // 2
-            center_y = img.height // 2
-            offset = int(min(img.width, img.height) * 0.15)  # 중앙에서 15% 떨어진 위치
-
-            positions = [
-                # 중앙-좌상단
-                (center_x - offset - text_width // 2, center_y - offset - text_height // 2),
-                # 중앙-우하단
-                (center_x + offset - text_width // 2, center_y + offset - text_height // 2),
-            ]
-
-            # 더 연한 반투명 텍스트 (투명도 낮춤)
-            outline_color = (0, 0, 0, 40)  # 테두리 더 연하게
-            text_color = (255, 255, 255, 80)  # 텍스트 더 연하게
-
-            for x, y in positions:
-                # 테두리 (연한 검은색)
-                for dx, dy in [(-2, -2), (-2, 2), (2, -2), (2, 2), (-2, 0), (2, 0), (0, -2), (0, 2)]:
-                    draw.text((x + dx, y + dy), watermark_text, font=font, fill=outline_color)
-                # 메인 텍스트 (연한 반투명 흰색)
-                draw.text((x, y), watermark_text, font=font, fill=text_color)
-
-            # 레이어 합성
-            watermarked = Image.alpha_composite(img, txt_layer)
-
-            # RGB로 변환 후 저장 (JPEG 호환)
-            watermarked = watermarked.convert('RGB')
-            watermarked.save(img_path, quality=90, optimize=True)
-
+            name = derivative_name(self.image.name, self.coordinate.watermark_text)
+            if derivative_exists(name):
+                return default_storage.url(name)
+            request_derivatives(self.coordinate_id)
         except Exception as e:
             # 워터마크 실패해도 이미지는 유지
             import logging
             logging.error(f"워터마크 적용 실패: {e}")
+        return self.image.url
@@ -4,6 +4,8 @@ import logging
 import threading
 from functools import lru_cache
 
+from apps.core.http import get_upstream
+
 logger = logging.getLogger(__name__)
 
 # 국가 코드 → 지역 매핑
@@ -45,7 +47,6 @@ COUNTRY_TO_REGION = {
 # Nominatim API 설정
 NOMINATIM_URL = "https://nominatim.openstreetmap.org/reverse"
 USER_AGENT = "PikminDiary/1.0 (pikmindiary.com)"
-REQUEST_TIMEOUT = 10
 
 
 def detect_region_from_nominatim(latitude, longitude):
@@ -68,11 +69,11 @@ def detect_region_from_nominatim(latitude, longitude):
             'User-Agent': USER_AGENT,
         }
         
-        response = requests.get(
+        # 타임아웃/재시도/서킷 브레이커는 settings.OUTBOUND_HTTP['nominatim']
+        response = get_upstream('nominatim').get(
             NOMINATIM_URL,
             params=params,
             headers=headers,
-            timeout=REQUEST_TIMEOUT
         )
         response.raise_for_status()
         
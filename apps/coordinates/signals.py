@@ -1,9 +1,11 @@
 """Signals for coordinates app"""
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 
-from .models import Coordinate
+from .models import Coordinate, CoordinateImage
 from .region_utils import update_coordinate_region_async
+from .watermark_utils import delete_derivatives
 
 
 @receiver(post_save, sender=Coordinate)
@@ -16,3 +18,11 @@ def update_region_after_save(sender, instance, created, **kwargs):
     if created:
         # 새 게시글일 때만 API 호출 (수정 시에는 호출 안 함)
         update_coordinate_region_async(instance.pk)
+
+
+@receiver(post_delete, sender=CoordinateImage)
+def delete_image_derivatives(sender, instance, **kwargs):
+    """이미지 삭제 시 워터마크 파생 파일도 삭제 (게시글 삭제로 함께 지워지는 경우 포함)"""
+    if instance.image:
+        image_name = instance.image.name
+        transaction.on_commit(lambda: delete_derivatives(image_name))
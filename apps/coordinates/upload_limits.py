@@ -0,0 +1,54 @@
+"""일일 업로드 제한 카운터 - (회원 또는 IP, 카테고리, 날짜)별 캐시 카운터"""
+from datetime import datetime, time, timedelta
+
+from django.core.cache import cache
+from django.utils import timezone
+
+
+def _counter_key(subject, category, day):
+    return f'coordinates:uploads:{subject}:{category}:{day:%Y%m%d}'
+
+
+def _seconds_until_tomorrow():
+    """오늘 자정까지 남은 시간 (+1시간 여유)"""
+    now = timezone.localtime()
+    tomorrow = timezone.make_aware(datetime.combine(now.date() + timedelta(days=1), time.min))
+    return int((tomorrow - now).total_seconds()) + 3600
+
+
+def reserve_upload(subject, category, seed=None):
+    """
+    업로드 1건을 예약하고 예약 후 오늘 업로드 수 반환 (원자적 증가)
+    - subject: 'user:<id>' 또는 'ip:<주소>'
+    - seed: 카운터가 없을 때 초기값을 계산하는 함수 (회원은 DB의 오늘 글 수)
+    """
+    key = _counter_key(subject, category, timezone.localdate())
+    try:
+        return cache.incr(key)
+    except ValueError:
+        initial = seed() if seed else 0
+        if cache.add(key, initial + 1, _seconds_until_tomorrow()):
+            return initial + 1
+        # 다른 요청이 먼저 카운터를 만든 경우
+        return cache.incr(key)
+
+
+def release_upload(subject, category):
+    """예약 취소 (제한 초과 또는 등록 실패 시)"""
+    key = _counter_key(subject, category, timezone.localdate())
+    try:
+        cache.decr(key)
+    except ValueError:
+        pass
+
+
+def today_upload_count(author, category):
+    """회원의 오늘 카테고리별 게시글 수 (카운터 초기값용)"""
+    from .models import Coordinate
+
+    today_start = timezone.make_aware(datetime.combine(timezone.localdate(), time.min))
+    return Coordinate.objects.filter(
+        author=author,
+        category=category,
+        created_at__gte=today_start,
+    ).count()
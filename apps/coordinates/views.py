@@ -10,13 +10,52 @@ from django.utils.translation import gettext as _
 from django.contrib.auth.hashers import make_password, check_password
 
 from .models import Coordinate, CoordinateImage
+from .upload_limits import reserve_upload, release_upload, today_upload_count
+from .watermark_utils import (
+    DEFAULT_WATERMARK_TEXT, derivative_name, generate_derivatives_async,
+    prepare_coordinate_image, store_derivative,
+)
+from apps.core.uploads import process_image_uploads, ImageUploadError
 from apps.interactions.models import Like, Bookmark
-from apps.rankings.utils import update_user_ranking
+from apps.rankings.utils import apply_ranking_delta
+from apps.translations.services import prefetch_translations
+
+
+def _prepare_images(files, watermark_text=None):
+    """업로드 이미지들을 병렬 처리. [(원본 ContentFile, 워터마크 바이트 또는 None), ...] 반환"""
+    return process_image_uploads(
+        files,
+        task=lambda f: prepare_coordinate_image(f, watermark_text),
+    )
+
+
+def _save_images(coordinate, prepared_images, watermark_text=None, start_order=0):
+    """처리된 이미지 저장 + 미리 만든 워터마크 파생 이미지 저장"""
+    for i, (content, watermarked) in enumerate(prepared_images):
+        image = CoordinateImage.objects.create(
+            coordinate=coordinate,
+            image=content,
+            order=start_order + i
+        )
+        if watermarked:
+            store_derivative(derivative_name(image.image.name, watermark_text), watermarked)
+
+
+def _is_exempt_ranker(author, exempt_rank):
+    """전체 랭킹 exempt_rank위 이내 회원은 일일 업로드 제한 없음"""
+    if not author or exempt_rank <= 0:
+        return False
+
+    from apps.rankings.models import Ranking
+    from apps.rankings.leaderboard import get_leaderboard
+
+    rank = get_leaderboard(Ranking.PeriodType.ALL).rank_of(author.pk)
+    return rank is not None and rank <= exempt_rank
 
 
 def coordinate_list(request):
     """좌표 목록 (검색/필터/정렬) - 무한 스크롤 지원"""
-    queryset = Coordinate.objects.filter(status=Coordinate.Status.APPROVED)
+    queryset = Coordinate.objects.filter(status=Coordinate.Status.APPROVED).select_related('author')
     
     # 검색
     query = request.GET.get('q', '')
@@ -58,7 +97,8 @@ def coordinate_list(request):
         page_number = 1
 
     offset = (page_number - 1) * PAGE_SIZE
-    first_page_items = list(queryset[offset:offset + PAGE_SIZE])
+    # 카드에 표시되는 필드 번역을 쿼리 1번으로 미리 불러옴
+    first_page_items = prefetch_translations(queryset[offset:offset + PAGE_SIZE], ['title', 'postcard_name'])
     has_next = queryset.count() > offset + PAGE_SIZE
     
     # AJAX 요청인 경우 JSON으로 카드 HTML 반환
@@ -163,7 +203,7 @@ def coordinate_detail(request, pk):
     # 댓글 정렬
     from apps.comments.models import Comment
     from apps.interactions.models import CommentLike
-    from django.db.models import Count
+    from django.db.models import Count, Prefetch
 
     sort = request.GET.get('sort', 'likes')  # 기본값: 좋아요순
 
@@ -171,7 +211,9 @@ def coordinate_detail(request, pk):
         coordinate=coordinate,
         is_deleted=False,
         parent__isnull=True  # 최상위 댓글만
-    ).select_related('author').prefetch_related('replies')
+    ).select_related('author').prefetch_related(
+        Prefetch('replies', queryset=Comment.objects.select_related('author'))
+    )
 
     # 정렬 적용
     if sort == 'newest':
@@ -197,12 +239,14 @@ def coordinate_detail(request, pk):
         # 비회원은 세션에서 가져오기
         user_liked_comments = request.session.get('liked_comments', [])
 
+    prefetch_translations([coordinate], ['title', 'description'])
+
     context = {
         'coordinate': coordinate,
         'images': coordinate.images.all(),
         'user_liked': user_liked,
         'user_bookmarked': user_bookmarked,
-        'comments': comments,
+        'comments': prefetch_translations(comments, ['content']),
         'comment_sort': sort,
         'user_liked_comments': user_liked_comments,
     }
@@ -249,57 +293,34 @@ def coordinate_create(request):
         
         # ===== 일일 업로드 제한 체크 =====
         from apps.core.models import SiteSettings
-        from apps.rankings.models import Ranking
         
-        settings = SiteSettings.get_settings()
+        settings = SiteSettings.get_settings()  # 프로세스 내 캐시
         DAILY_LIMIT = settings.daily_upload_limit
         exempt_rank = settings.ranker_limit_exempt_rank
         
-        # 랭커 제한 해제 체크
-        is_exempt_ranker = False
-        if author and exempt_rank > 0:
-            # 전체 랭킹에서 현재 사용자 순위 확인
-            try:
-                current_ranking = Ranking.objects.filter(
-                    user=author,
-                    period_type=Ranking.PeriodType.ALL
-                ).order_by('-period_start').first()
-                
-                if current_ranking and 0 < current_ranking.rank <= exempt_rank:
-                    is_exempt_ranker = True
-            except Exception:
-                pass
-        
-        # 제한 체크 (랭커가 아닌 경우에만)
-        if not is_exempt_ranker and DAILY_LIMIT > 0:
-            today_start = timezone.now().replace(hour=0, minute=0, second=0, microsecond=0)
-            today_end = today_start + timezone.timedelta(days=1)
-            
-            # 오늘 이 카테고리에 올린 게시글 수 체크
+        # 캐시 카운터로 업로드 1건 예약 (회원: 사용자 기준, 비회원: IP 기준)
+        upload_subject = None
+        if DAILY_LIMIT > 0:
             if author:
-                # 회원: 사용자 기준
-                today_count = Coordinate.objects.filter(
-                    author=author,
-                    category=category,
-                    created_at__gte=today_start,
-                    created_at__lt=today_end
-                ).count()
+                upload_subject = f'user:{author.pk}'
+                today_count = reserve_upload(
+                    upload_subject, category,
+                    seed=lambda: today_upload_count(author, category),
+                )
             else:
-                # 비회원: IP 기준 (세션에 저장)
-                client_ip = get_client_ip(request)
-                # 세션에 업로드 기록 저장
-                upload_key = f'uploads_{category}_{timezone.now().strftime("%Y%m%d")}'
-                upload_count = request.session.get(upload_key, 0)
-                today_count = upload_count
+                upload_subject = f'ip:{get_client_ip(request)}'
+                today_count = reserve_upload(upload_subject, category)
             
-            if today_count >= DAILY_LIMIT:
+            # 제한 초과 시에만 랭커 제한 해제 여부 확인
+            if today_count > DAILY_LIMIT and not _is_exempt_ranker(author, exempt_rank):
+                release_upload(upload_subject, category)
                 category_label = dict(Coordinate.Category.choices).get(category, category)
                 messages.error(request, _('오늘 %(category)s 카테고리에 %(limit)s개를 이미 등록했습니다. 내일 다시 시도해주세요.') % {'category': category_label, 'limit': DAILY_LIMIT})
                 return render(request, 'coordinates/create.html', {
                     'categories': Coordinate.Category.choices,
                 })
         # ===== 제한 체크 끝 =====
-        
+
         # 워터마크 옵션
         watermark_enabled = request.POST.get('watermark_enabled') == 'on'
         watermark_name = request.POST.get('watermark_name', '').strip()
@@ -308,43 +329,51 @@ def coordinate_create(request):
         if watermark_enabled and not watermark_name and not author:
             watermark_name = guest_nickname
 
-        coordinate = Coordinate.objects.create(
-            author=author,
-            title=title,
-            postcard_name=postcard_name,
-            description=description,
-            latitude=latitude,
-            longitude=longitude,
-            category=category,
-            guest_password=hashed_password,
-            status=Coordinate.Status.APPROVED,
-            approved_at=timezone.now(),
-            watermark_enabled=watermark_enabled,
-            watermark_name=watermark_name,
-        )
-        
-        # 비회원의 경우 세션에 업로드 기록 저장
-        if not author:
-            upload_key = f'uploads_{category}_{timezone.now().strftime("%Y%m%d")}'
-            current_count = request.session.get(upload_key, 0)
-            request.session[upload_key] = current_count + 1
+        # 이미지 검증 + 정규화 + 워터마크 (게시글 생성 전에 병렬로 모두 처리)
+        watermark_text = None
+        if watermark_enabled:
+            watermark_text = watermark_name or (author.nickname if author else DEFAULT_WATERMARK_TEXT)
+        try:
+            images = _prepare_images(request.FILES.getlist('images')[:5], watermark_text)  # 최대 5장
+        except ImageUploadError as e:
+            if upload_subject:
+                release_upload(upload_subject, category)
+            messages.error(request, str(e))
+            return render(request, 'coordinates/create.html', {
+                'categories': Coordinate.Category.choices,
+            })
         
-        # 이미지 처리
-        images = request.FILES.getlist('images')
-        for i, image in enumerate(images[:5]):  # 최대 5장
-            CoordinateImage.objects.create(
-                coordinate=coordinate,
-                image=image,
-                order=i
+        try:
+            coordinate = Coordinate.objects.create(
+                author=author,
+                title=title,
+                postcard_name=postcard_name,
+                description=description,
+                latitude=latitude,
+                longitude=longitude,
+                category=category,
+                guest_password=hashed_password,
+                status=Coordinate.Status.APPROVED,
+                approved_at=timezone.now(),
+                watermark_enabled=watermark_enabled,
+                watermark_name=watermark_name,
             )
+            
+            # 이미지 저장
+            _save_images(coordinate, images, watermark_text)
+        except Exception:
+            # 등록 실패 시 업로드 예약 취소
+            if upload_subject:
+                release_upload(upload_subject, category)
+            raise
         
         # 번역 생성
         from apps.translations.services import translate_on_create
         translate_on_create(coordinate, ['title', 'description', 'postcard_name'])
 
-        # 랭킹 갱신 (회원인 경우)
+        # 랭킹 반영 (회원인 경우)
         if author:
-            update_user_ranking(author)
+            apply_ranking_delta(author, occurred_at=coordinate.approved_at, posts=1)
 
         messages.success(request, _('좌표가 등록되었습니다.'))
         return redirect('coordinates:detail', pk=coordinate.pk)
@@ -382,21 +411,23 @@ def coordinate_edit(request, pk):
         coordinate.longitude = request.POST.get('longitude', coordinate.longitude)
         coordinate.category = request.POST.get('category', coordinate.category)
 
-        # 워터마크 옵션 처리
-        old_watermark_enabled = coordinate.watermark_enabled
+        # 워터마크 옵션 처리 (메타데이터만 변경 - 파생 이미지는 별도 생성)
         coordinate.watermark_enabled = request.POST.get('watermark_enabled') == 'on'
         coordinate.watermark_name = request.POST.get('watermark_name', '').strip()
 
-        coordinate.save()
+        # 새 이미지 검증 + 정규화 + 워터마크 (수정 반영 전에 병렬로 처리, 빈 자리 수만큼만 - 최대 5장)
+        delete_image_ids = request.POST.getlist('delete_images')
+        free_slots = max(0, 5 - coordinate.images.exclude(pk__in=delete_image_ids).count())
+        watermark_text = coordinate.watermark_text if coordinate.watermark_enabled else None
+        try:
+            new_images = _prepare_images(request.FILES.getlist('images')[:free_slots], watermark_text)
+        except ImageUploadError as e:
+            messages.error(request, str(e))
+            return redirect('coordinates:edit', pk=pk)
 
-        # 기존 이미지에 워터마크 적용 (새로 활성화한 경우)
-        if coordinate.watermark_enabled and not old_watermark_enabled:
-            for img in coordinate.images.all():
-                img.coordinate.refresh_from_db()  # DB에서 최신 값 다시 로드
-                img._apply_watermark()
+        coordinate.save()
 
         # 이미지 삭제 처리
-        delete_image_ids = request.POST.getlist('delete_images')
         if delete_image_ids:
             CoordinateImage.objects.filter(
                 pk__in=delete_image_ids,
@@ -405,15 +436,15 @@ def coordinate_edit(request, pk):
         
         # 새 이미지 추가 처리
         current_image_count = coordinate.images.count()
-        new_images = request.FILES.getlist('images')
-        for i, image in enumerate(new_images):
-            if current_image_count + i >= 5:  # 최대 5장
-                break
-            CoordinateImage.objects.create(
-                coordinate=coordinate,
-                image=image,
-                order=current_image_count + i
-            )
+        _save_images(
+            coordinate,
+            new_images[:max(0, 5 - current_image_count)],  # 최대 5장 (동시 수정 대비 다시 확인)
+            watermark_text,
+            start_order=current_image_count,
+        )
+
+        # 기존 이미지의 워터마크 파생 이미지를 현재 설정에 맞춤 (이미 있는 조합은 건너뜀, 이전 텍스트/해제 시 삭제)
+        generate_derivatives_async(coordinate.pk)
         
         messages.success(request, _('좌표가 수정되었습니다.'))
         return redirect('coordinates:detail', pk=pk)
@@ -480,6 +511,10 @@ def copy_coords(request, pk):
         coordinate.refresh_from_db()
         new_count = coordinate.copy_count
         
+        # 작성자 랭킹 반영 (승인된 글의 복사 수만 집계)
+        if coordinate.author and coordinate.status == Coordinate.Status.APPROVED:
+            apply_ranking_delta(coordinate.author, occurred_at=coordinate.approved_at, copies=1)
+        
         # 마일스톤 알림 (5, 10, 50, 100, 500, 1000)
         milestones = [5, 10, 50, 100, 500, 1000]
         for milestone in milestones:
@@ -533,7 +568,7 @@ def map_view(request):
             'category_display': coord.get_category_display(),
             'region': coord.region,
             'region_display': coord.get_region_display(),
-            'image': first_image.image.url if first_image else None,
+            'image': first_image.display_url if first_image else None,
             'copy_count': coord.copy_count,
             'like_count': coord.like_count,
         })
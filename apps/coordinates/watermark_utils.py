@@ -0,0 +1,231 @@
+"""Watermark utilities - 원본은 그대로 두고 워터마크 버전을 파생 파일로 생성"""
+import hashlib
+import io
+import logging
+import threading
+from functools import lru_cache
+
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WATERMARK_TEXT = "피크민다이어리"
+
+# 파생 이미지 저장 경로 (원본 경로와 분리)
+DERIVATIVE_DIR = 'coordinates/watermarked'
+
+# 한글 지원 폰트 (Bold 폰트 우선)
+FONT_CANDIDATES = [
+    # 우분투/데비안 한글 Bold 폰트
+    '/usr/share/fonts/truetype/nanum/NanumGothicBold.ttf',
+    # 일반 나눔고딕
+    '/usr/share/fonts/truetype/nanum/NanumGothic.ttf',
+    # 대체 폰트
+    '/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf',
+]
+
+# 화면 요청에서 예약한 파생 이미지 생성 (좌표당 1번, 워커 간 공유 - 실패 시 이 시간 뒤 재시도)
+PENDING_TIMEOUT = 60
+
+# 이미 존재가 확인된 파생 파일 (프로세스 내 캐시 - 매 렌더마다 파일 시스템 조회 방지)
+_known_derivatives = set()
+_known_lock = threading.Lock()
+
+
+@lru_cache(maxsize=32)
+def _load_font(font_size):
+    """폰트 로드 (크기별 캐시)"""
+    from PIL import ImageFont
+
+    for path in FONT_CANDIDATES:
+        try:
+            return ImageFont.truetype(path, font_size)
+        except OSError:
+            continue
+    return ImageFont.load_default()
+
+
+def render_watermark(img, watermark_text):
+    """PIL 이미지에 워터마크를 그려 새 RGB 이미지 반환 (원본 객체는 변경하지 않음)"""
+    from PIL import Image, ImageDraw
+
+    # RGBA로 변환 (투명도 지원)
+    if img.mode != 'RGBA':
+        img = img.convert('RGBA')
+
+    # 워터마크 레이어 생성
+    txt_layer = Image.new('RGBA', img.size, (255, 255, 255, 0))
+    draw = ImageDraw.Draw(txt_layer)
+
+    # 폰트 크기 계산 (이미지 너비의 5% - 더 굵직하게)
+    font_size = max(24, int(img.width * 0.05))
+    font = _load_font(font_size)
+
+    # 텍스트 크기 계산
+    bbox = draw.textbbox((0, 0), watermark_text, font=font)
+    text_width = bbox[2] - bbox[0]
+    text_height = bbox[3] - bbox[1]
+
+    # 워터마크 위치 계산 (중앙 영역 대각선 배치)
+    # 이미지 중앙에서 좌상단, 우하단으로 대각선 배치
+    center_x = img.width // 2
+    center_y = img.height // 2
+    offset = int(min(img.width, img.height) * 0.15)  # 중앙에서 15% 떨어진 위치
+
+    positions = [
+        # 중앙-좌상단
+        (center_x - offset - text_width // 2, center_y - offset - text_height // 2),
+        # 중앙-우하단
+        (center_x + offset - text_width // 2, center_y + offset - text_height // 2),
+    ]
+
+    # 더 연한 반투명 텍스트 (투명도 낮춤)
+    outline_color = (0, 0, 0, 40)  # 테두리 더 연하게
+    text_color = (255, 255, 255, 80)  # 텍스트 더 연하게
+
+    for x, y in positions:
+        # 테두리 (연한 검은색)
+        for dx, dy in [(-2, -2), (-2, 2), (2, -2), (2, 2), (-2, 0), (2, 0), (0, -2), (0, 2)]:
+            draw.text((x + dx, y + dy), watermark_text, font=font, fill=outline_color)
+        # 메인 텍스트 (연한 반투명 흰색)
+        draw.text((x, y), watermark_text, font=font, fill=text_color)
+
+    # 레이어 합성 후 RGB로 변환 (JPEG 호환)
+    return Image.alpha_composite(img, txt_layer).convert('RGB')
+
+
+def encode_watermarked(img, watermark_text):
+    """워터마크를 적용한 JPEG 바이트 반환"""
+    buffer = io.BytesIO()
+    render_watermark(img, watermark_text).save(buffer, format='JPEG', quality=90, optimize=True)
+    return buffer.getvalue()
+
+
+def derivative_dir(image_name):
+    """원본 이미지 1장의 파생 파일 디렉터리"""
+    key = hashlib.sha1(image_name.encode('utf-8')).hexdigest()
+    return f'{DERIVATIVE_DIR}/{key[:2]}/{key}'
+
+
+def derivative_name(image_name, watermark_text):
+    """(원본 이미지, 워터마크 텍스트) 조합으로 결정되는 파생 파일 경로"""
+    key = hashlib.sha1(watermark_text.encode('utf-8')).hexdigest()
+    return f'{derivative_dir(image_name)}/{key[:16]}.jpg'
+
+
+def _mark_known(name):
+    with _known_lock:
+        _known_derivatives.add(name)
+
+
+def derivative_exists(name):
+    """파생 파일 존재 여부 (확인된 경로는 프로세스 내에서 기억)"""
+    if name in _known_derivatives:
+        return True
+    if default_storage.exists(name):
+        _mark_known(name)
+        return True
+    return False
+
+
+def store_derivative(name, data):
+    """파생 파일 저장 (동일 이름이 이미 있으면 그대로 사용)"""
+    if not default_storage.exists(name):
+        saved_name = default_storage.save(name, ContentFile(data))
+        if saved_name != name:
+            # 동시 생성으로 다른 이름이 붙은 경우 중복본 정리
+            default_storage.delete(saved_name)
+    _mark_known(name)
+    return name
+
+
+def delete_derivatives(image_name, keep=None):
+    """원본 이미지의 파생 파일 삭제 (keep 경로는 유지) - 이미지 삭제, 워터마크 변경/해제 시"""
+    directory = derivative_dir(image_name)
+    try:
+        _, files = default_storage.listdir(directory)
+    except OSError:
+        return
+    for filename in files:
+        name = f'{directory}/{filename}'
+        if name == keep:
+            continue
+        default_storage.delete(name)
+        with _known_lock:
+            _known_derivatives.discard(name)
+
+
+def ensure_watermarked(image_file, watermark_text):
+    """
+    워터마크 파생 파일을 보장하고 경로 반환
+    - 이미 있으면 즉시 반환
+    - 없으면 원본에서 새로 생성 (원본 파일은 수정하지 않음)
+    """
+    from PIL import Image
+
+    name = derivative_name(image_file.name, watermark_text)
+    if derivative_exists(name):
+        return name
+
+    with default_storage.open(image_file.name, 'rb') as f:
+        img = Image.open(f)
+        img.load()
+
+    return store_derivative(name, encode_watermarked(img, watermark_text))
+
+
+def prepare_coordinate_image(uploaded_file, watermark_text=None):
+    """
+    업로드 이미지 1장 처리 (스레드 풀 작업 단위)
+    - 검증/디코딩/리사이즈 → 원본 ContentFile
+    - 워터마크 사용 시 같은 디코딩 결과로 파생 이미지 바이트도 생성
+    """
+    from apps.core.uploads import decode_image_upload, encode_image
+
+    img, image_format, extension = decode_image_upload(uploaded_file)
+    content = encode_image(img, image_format, extension, uploaded_file.name)
+    watermarked = encode_watermarked(img, watermark_text) if watermark_text else None
+    return content, watermarked
+
+
+def generate_derivatives_async(coordinate_id):
+    """
+    백그라운드 스레드에서 좌표의 이미지 워터마크 파생 파일을 현재 설정에 맞춤
+    - 현재 워터마크 텍스트의 파생 파일 생성, 이전 텍스트의 파생 파일은 삭제
+    - 워터마크를 해제했으면 파생 파일 모두 삭제
+    - 생성 전에는 원본이 표시되고 생성이 예약됨 (CoordinateImage.display_url → request_derivatives)
+    """
+    def _generate():
+        from django.db import close_old_connections
+
+        try:
+            # 지연 import로 순환 참조 방지
+            from .models import Coordinate
+
+            coordinate = Coordinate.objects.get(pk=coordinate_id)
+            watermark_text = coordinate.watermark_text if coordinate.watermark_enabled else None
+
+            for img in coordinate.images.filter(watermark_baked=False):
+                keep = ensure_watermarked(img.image, watermark_text) if watermark_text else None
+                delete_derivatives(img.image.name, keep=keep)
+
+            cache.delete(_pending_key(coordinate_id))
+        except Exception as e:
+            logger.error(f"워터마크 파생 이미지 생성 실패 (Coordinate {coordinate_id}): {e}")
+        finally:
+            close_old_connections()
+
+    thread = threading.Thread(target=_generate, daemon=True)
+    thread.start()
+
+
+def _pending_key(coordinate_id):
+    return f'coordinates:watermark:pending:{coordinate_id}'
+
+
+def request_derivatives(coordinate_id):
+    """화면 요청 중 파생 이미지가 없을 때 - 좌표당 1번만 백그라운드 생성 예약"""
+    if cache.add(_pending_key(coordinate_id), 1, PENDING_TIMEOUT):
+        generate_derivatives_async(coordinate_id)
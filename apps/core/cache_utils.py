@@ -0,0 +1,35 @@
+"""캐시 무효화 버전 관리 - 프로세스 내 캐시를 여러 워커에서 함께 무효화하기 위한 토큰"""
+import uuid
+
+from django.core.cache import cache, caches
+
+# 워커 프로세스마다 따로 저장되는 캐시 백엔드
+PROCESS_LOCAL_BACKENDS = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+
+def is_shared_cache(alias='default'):
+    """캐시를 여러 워커 프로세스가 공유하는지 (버전 토큰, 업로드 카운터가 워커 사이에 일관되려면 필요)"""
+    backend = type(caches[alias])
+    return f'{backend.__module__}.{backend.__qualname__}' not in PROCESS_LOCAL_BACKENDS
+
+
+def get_version(key):
+    """
+    현재 버전 토큰 반환
+    - 캐시에서 사라졌으면 새 토큰을 만들어 저장 (→ 기존 로컬 캐시는 자연히 무효화)
+    """
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, uuid.uuid4().hex, None)
+        version = cache.get(key)
+    return version
+
+
+def bump_version(key):
+    """버전 토큰 교체 - 이 토큰을 기준으로 캐시한 값이 모두 무효화됨"""
+    version = uuid.uuid4().hex
+    cache.set(key, version, None)
+    return version
@@ -0,0 +1,20 @@
+"""시스템 체크 - 운영 환경 설정 확인"""
+from django.conf import settings
+from django.core.checks import Error, Tags, register
+
+from .cache_utils import is_shared_cache
+
+
+@register(Tags.caches)
+def check_shared_cache(app_configs, **kwargs):
+    """운영(REQUIRE_SHARED_CACHE, 기본값 DEBUG=False)에서는 워커 사이에 공유되는 캐시(REDIS_URL) 필수"""
+    if not getattr(settings, 'REQUIRE_SHARED_CACHE', False) or is_shared_cache():
+        return []
+    return [
+        Error(
+            '캐시가 워커 프로세스마다 따로 저장됩니다 (LocMemCache).',
+            hint='REDIS_URL을 설정하세요. 설정하지 않으면 일일 업로드 제한이 워커마다 따로 계산되고 '
+                 '사이트 설정 변경이 다른 워커에 늦게 반영됩니다.',
+            id='core.E001',
+        )
+    ]
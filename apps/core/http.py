@@ -0,0 +1,278 @@
+"""외부 HTTP 호출 공통 클라이언트 - DeepL, Nominatim, GeoIP 데이터베이스 다운로드 등 업스트림별 관리
+
+업스트림마다
+    - keep-alive 연결 풀 (requests.Session + HTTPAdapter)
+    - 연결/응답 타임아웃
+    - 재시도 + 지수 백오프
+        GET: 연결 오류, 응답 타임아웃, 429, 5xx
+        POST: 연결 오류, 429/503만 (서버가 처리하지 않은 요청 - 응답 타임아웃 후 재전송하면 DeepL 글자 수가 중복 과금될 수 있음)
+        Retry-After 헤더가 있으면 그 시간만큼 대기
+    - 서킷 브레이커: 연속 실패가 쌓이면 일정 시간 동안 바로 실패 (요청 스레드가 묶이지 않도록)
+    - (선택) 토큰 버킷 속도 제한: 초당 요청 수를 넘으면 토큰이 생길 때까지 대기
+    - 지표: 요청/오류/차단 수, 송수신 바이트, 지연 시간
+설정은 settings.OUTBOUND_HTTP[업스트림 이름]으로 덮어쓸 수 있음
+"""
+import threading
+import time
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+DEFAULT_CONFIG = {
+    'timeout': (3, 10),           # (연결, 응답) 초
+    'retries': 2,
+    'backoff': 0.5,               # 0.5s, 1s, ...
+    'retry_statuses': (429, 500, 502, 503, 504),
+    'retry_methods': ('GET', 'HEAD'),       # 모든 오류에 재시도하는 멱등 메서드
+    'unprocessed_statuses': (429, 503),     # 처리되지 않은 응답 - 그 외 메서드(POST)도 재시도
+    'max_retry_after': 10,                  # Retry-After 최대 대기 시간(초) - 요청 스레드가 오래 묶이지 않도록
+    'pool_size': 10,
+    'failure_threshold': 5,       # 연속 실패 N번이면 차단
+    'reset_timeout': 30,          # 차단 후 N초 뒤 1번 시험 요청 허용
+    'rate': None,                 # 초당 최대 요청 수 (None이면 제한 없음)
+    'burst': 1,                   # 한 번에 몰아서 보낼 수 있는 요청 수
+}
+
+_upstreams = {}
+_upstreams_lock = threading.Lock()
+
+
+class UpstreamUnavailable(requests.exceptions.RequestException):
+    """서킷 브레이커가 열려 있어 요청을 보내지 않음"""
+
+
+class CircuitBreaker:
+    """연속 실패 횟수 기반 서킷 브레이커 (closed → open → half-open → closed)"""
+
+    CLOSED, OPEN, HALF_OPEN = 'closed', 'open', 'half_open'
+
+    def __init__(self, failure_threshold, reset_timeout):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """요청을 보내도 되는지 (open 상태면 reset_timeout 후 1건만 허용)"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+
+class TokenBucket:
+    """토큰 버킷 속도 제한 - 스레드 여러 개가 같은 버킷을 공유 (초당 rate개, 최대 burst개 적립)"""
+
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """토큰 1개 사용 (없으면 생길 때까지 대기)"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class UpstreamMetrics:
+    """업스트림별 누적 지표 (프로세스 단위)"""
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.short_circuited = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, latency, sent=0, received=0, error=False):
+        with self._lock:
+            self.requests += 1
+            self.errors += int(error)
+            self.bytes_sent += sent
+            self.bytes_received += received
+            self.total_latency += latency
+            self.max_latency = max(self.max_latency, latency)
+
+    def record_short_circuit(self):
+        with self._lock:
+            self.short_circuited += 1
+
+    def as_dict(self):
+        completed = self.requests or 1
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'short_circuited': self.short_circuited,
+            'bytes_sent': self.bytes_sent,
+            'bytes_received': self.bytes_received,
+            'avg_latency_ms': round(self.total_latency / completed * 1000, 1),
+            'max_latency_ms': round(self.max_latency * 1000, 1),
+        }
+
+
+class Upstream:
+    """업스트림 1개 (세션 + 서킷 브레이커 + 지표)"""
+
+    def __init__(self, name, config):
+        self.name = name
+        self.timeout = config['timeout']
+        self.retries = config['retries']
+        self.backoff = config['backoff']
+        self.retry_statuses = set(config['retry_statuses'])
+        self.retry_methods = frozenset(config['retry_methods'])
+        self.unprocessed_statuses = set(config['unprocessed_statuses'])
+        self.max_retry_after = config['max_retry_after']
+        self.breaker = CircuitBreaker(config['failure_threshold'], config['reset_timeout'])
+        self.metrics = UpstreamMetrics()
+        self.rate_limiter = TokenBucket(config['rate'], config['burst']) if config['rate'] else None
+
+        # 연결 오류는 모든 메서드 재시도 (요청이 전송되지 않음), 응답 타임아웃/상태 코드 재시도는 retry_methods만
+        retry = Retry(
+            total=config['retries'],
+            backoff_factor=config['backoff'],
+            status_forcelist=config['retry_statuses'],
+            allowed_methods=self.retry_methods,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=config['pool_size'], max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def request(self, method, url, **kwargs):
+        """
+        요청 전송 - requests.Response 반환
+        - 서킷이 열려 있으면 UpstreamUnavailable
+        - 연결 오류/타임아웃은 requests 예외 그대로 전달
+        """
+        if not self.breaker.allow():
+            self.metrics.record_short_circuit()
+            raise UpstreamUnavailable(f"{self.name}: circuit open")
+
+        kwargs.setdefault('timeout', self.timeout)
+        started = time.monotonic()
+        try:
+            response = self._send(method, url, **kwargs)
+        except requests.exceptions.RequestException:
+            self.breaker.record_failure()
+            self.metrics.record(time.monotonic() - started, error=True)
+            raise
+
+        failed = response.status_code in self.retry_statuses
+        if failed:
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+
+        body = response.request.body or b''
+        self.metrics.record(
+            time.monotonic() - started,
+            sent=len(body),
+            received=self._response_size(response, kwargs.get('stream', False)),
+            error=failed or response.status_code >= 400,
+        )
+        return response
+
+    def _send(self, method, url, **kwargs):
+        """
+        요청 전송 (속도 제한 포함)
+        - retry_methods 외의 메서드(POST)는 urllib3가 상태 코드로 재시도하지 않으므로
+          처리되지 않은 응답(429/503)일 때만 여기서 재시도
+        """
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            response = self.session.request(method, url, **kwargs)
+            if (method.upper() in self.retry_methods
+                    or response.status_code not in self.unprocessed_statuses
+                    or attempt >= self.retries):
+                return response
+            time.sleep(self._retry_delay(response, attempt))
+            response.close()
+            attempt += 1
+
+    def _retry_delay(self, response, attempt):
+        """Retry-After(초) 우선, 없으면 지수 백오프"""
+        try:
+            delay = float(response.headers.get('Retry-After', ''))
+        except ValueError:
+            delay = self.backoff * (2 ** attempt)
+        return max(0, min(delay, self.max_retry_after))
+
+    @staticmethod
+    def _response_size(response, stream):
+        """수신 바이트 - Content-Length 우선 (스트리밍 응답은 본문을 읽지 않음)"""
+        length = response.headers.get('Content-Length')
+        if length and length.isdigit():
+            return int(length)
+        # stream=False면 requests가 이미 본문을 모두 읽은 상태
+        return 0 if stream else len(response.content)
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    def set_rate_limit(self, rate, burst=1):
+        """속도 제한 변경 (None이면 해제) - 일괄 작업에서 요금제 한도에 맞출 때 사용"""
+        self.rate_limiter = TokenBucket(rate, burst) if rate else None
+
+    def status(self):
+        return {
+            'state': self.breaker.state,
+            'consecutive_failures': self.breaker.failures,
+            **self.metrics.as_dict(),
+        }
+
+
+def get_upstream(name):
+    """이름별 Upstream (프로세스당 1개, 첫 사용 시 생성)"""
+    upstream = _upstreams.get(name)
+    if upstream is None:
+        with _upstreams_lock:
+            upstream = _upstreams.get(name)
+            if upstream is None:
+                config = {**DEFAULT_CONFIG, **getattr(settings, 'OUTBOUND_HTTP', {}).get(name, {})}
+                upstream = Upstream(name, config)
+                _upstreams[name] = upstream
+    return upstream
+
+
+def upstream_status():
+    """사용 중인 모든 업스트림의 상태/지표"""
+    return {name: upstream.status() for name, upstream in sorted(_upstreams.items())}
@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-19 11:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_sitenotice_update_log_alter_sitenotice_content'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='suggestion',
+            name='source_languages',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
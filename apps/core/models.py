@@ -1,6 +1,17 @@
-from django.db import models
+import time
+
+from django.db import models, transaction
 from django.conf import settings
 
+from apps.translations.models import TranslatableModel
+
+from .cache_utils import get_version, bump_version
+
+# SiteSettings 프로세스 내 캐시 (버전 토큰이 바뀌면 다시 조회)
+SITE_SETTINGS_VERSION_KEY = 'core:site_settings:version'
+SITE_SETTINGS_MAX_AGE = 60  # 버전이 그대로여도 이 시간(초)이 지나면 다시 조회 (캐시를 공유하지 않는 워커 대비)
+_site_settings_cache = {'version': None, 'loaded_at': 0.0, 'obj': None}
+
 
 class SiteNotice(models.Model):
     """관리자가 수정할 수 있는 사이트 공지/메시지"""
@@ -31,8 +42,10 @@ class SiteNotice(models.Model):
         return f"[{self.get_location_display()}] {self.title or '공지'}"
 
 
-class Suggestion(models.Model):
+class Suggestion(TranslatableModel):
     """운영자에게 건의하기"""
+
+    translatable_fields = ('title', 'content')
     
     class Status(models.TextChoices):
         PENDING = 'PENDING', '대기중'
@@ -127,9 +140,18 @@ class SiteSettings(models.Model):
         # 싱글톤: 항상 pk=1만 허용
         self.pk = 1
         super().save(*args, **kwargs)
+        # 커밋 후 버전 변경 → 모든 워커의 캐시 무효화
+        transaction.on_commit(lambda: bump_version(SITE_SETTINGS_VERSION_KEY))
     
     @classmethod
     def get_settings(cls):
-        """설정 가져오기 (없으면 생성)"""
+        """설정 가져오기 (프로세스 내 캐시, 관리자 저장 시 무효화 + 최대 SITE_SETTINGS_MAX_AGE초. 없으면 생성)"""
+        version = get_version(SITE_SETTINGS_VERSION_KEY)
+        now = time.monotonic()
+        if (_site_settings_cache['version'] == version
+                and now - _site_settings_cache['loaded_at'] < SITE_SETTINGS_MAX_AGE):
+            return _site_settings_cache['obj']
+
         obj, _ = cls.objects.get_or_create(pk=1)
+        _site_settings_cache.update(version=version, loaded_at=now, obj=obj)
         return obj
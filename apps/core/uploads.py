@@ -0,0 +1,149 @@
+"""이미지 업로드 공통 처리 - 검증 + 정규화를 한 번에 (좌표/댓글/농사 일지/프로필 공용)
+
+업로드 파일은 아래 순서로 처리된 뒤 MEDIA_ROOT에 한 번만 저장됩니다.
+    1. 파일 크기 확인
+    2. 파일 헤더로 실제 형식 판별 (클라이언트 content_type은 신뢰하지 않음)
+    3. 헤더의 해상도로 픽셀 수 제한 (디코딩 전에 거부)
+       축소 디코딩이 없는 PNG/WEBP는 원본 해상도로 디코딩되므로 더 낮은 제한 적용
+    4. JPEG는 draft 모드로 축소 디코딩
+    5. EXIF 회전 적용 → 리사이즈(정수 배율 축소 후 LANCZOS) → 메타데이터 없이 재인코딩
+"""
+import io
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.utils.translation import gettext as _
+
+# 파일 시그니처 → (Pillow 형식, MIME 타입, 확장자)
+IMAGE_SIGNATURES = [
+    (b'\xff\xd8\xff', ('JPEG', 'image/jpeg', 'jpg')),
+    (b'\x89PNG\r\n\x1a\n', ('PNG', 'image/png', 'png')),
+]
+
+# 이미지 처리 스레드 풀 (지연 생성)
+_executor = None
+_executor_lock = threading.Lock()
+
+# 형식별 저장 옵션
+SAVE_OPTIONS = {
+    'JPEG': {'quality': 85, 'optimize': True},
+    'PNG': {'optimize': True},
+    'WEBP': {'quality': 85, 'method': 4},
+}
+
+
+class ImageUploadError(Exception):
+    """업로드 이미지 검증 실패 (사용자에게 보여줄 메시지를 담음)"""
+
+
+def sniff_image_format(header):
+    """파일 헤더 바이트로 이미지 형식 판별. 모르는 형식이면 None"""
+    for signature, info in IMAGE_SIGNATURES:
+        if header.startswith(signature):
+            return info
+    # WEBP: RIFF????WEBP
+    if len(header) >= 12 and header[:4] == b'RIFF' and header[8:12] == b'WEBP':
+        return ('WEBP', 'image/webp', 'webp')
+    return None
+
+
+def decode_image_upload(uploaded_file, max_dimension=None):
+    """
+    업로드 이미지를 검증하고 디코딩 + 회전 + 리사이즈까지 수행
+    - (PIL 이미지, Pillow 형식, 확장자) 튜플 반환
+    - 실패 시 ImageUploadError (메시지는 그대로 사용자에게 표시 가능)
+    """
+    from PIL import Image, ImageOps
+
+    max_size = getattr(settings, 'MAX_UPLOAD_SIZE', 5 * 1024 * 1024)
+    max_pixels = getattr(settings, 'MAX_IMAGE_PIXELS', 40_000_000)
+    max_full_decode_pixels = getattr(settings, 'MAX_FULL_DECODE_PIXELS', 16_000_000)
+    if max_dimension is None:
+        max_dimension = getattr(settings, 'IMAGE_MAX_DIMENSION', 1920)
+
+    if uploaded_file.size > max_size:
+        raise ImageUploadError(_('사진 파일 크기는 5MB를 초과할 수 없습니다.'))
+
+    # 헤더로 실제 형식 판별
+    uploaded_file.seek(0)
+    format_info = sniff_image_format(uploaded_file.read(16))
+    allowed_types = getattr(settings, 'ALLOWED_IMAGE_TYPES', ['image/jpeg', 'image/png', 'image/webp'])
+    if format_info is None or format_info[1] not in allowed_types:
+        raise ImageUploadError(_('허용되지 않는 파일 형식입니다. (JPG, PNG, WEBP만 가능)'))
+    image_format, _mime, extension = format_info
+
+    uploaded_file.seek(0)
+    try:
+        # open()은 헤더만 읽음 - 픽셀 수는 디코딩 전에 확인
+        img = Image.open(uploaded_file, formats=[image_format])
+        pixels = img.width * img.height
+        if pixels > max_pixels or (image_format != 'JPEG' and pixels > max_full_decode_pixels):
+            raise ImageUploadError(_('이미지 해상도가 너무 큽니다.'))
+
+        # JPEG: 목표 크기에 가까운 배율로 축소 디코딩 (메모리/시간 절약)
+        if image_format == 'JPEG':
+            img.draft('RGB', (max_dimension, max_dimension))
+        img.load()
+    except ImageUploadError:
+        raise
+    except (Image.DecompressionBombError, OSError, SyntaxError, ValueError):
+        raise ImageUploadError(_('이미지 파일을 읽을 수 없습니다.'))
+
+    # EXIF 회전 적용 (이후 저장 시 EXIF는 포함하지 않음)
+    img = ImageOps.exif_transpose(img)
+
+    if img.width > max_dimension or img.height > max_dimension:
+        # reducing_gap: 목표 크기의 3배까지는 정수 배율 축소(reduce)로 줄인 뒤 LANCZOS (원본 해상도 리샘플링 방지)
+        img.thumbnail((max_dimension, max_dimension), Image.LANCZOS, reducing_gap=3.0)
+
+    return img, image_format, extension
+
+
+def encode_image(img, image_format, extension, original_name=''):
+    """메타데이터 없이 재인코딩한 ContentFile 반환"""
+    if image_format == 'JPEG' and img.mode != 'RGB':
+        img = img.convert('RGB')
+    elif image_format != 'JPEG' and img.mode not in ('RGB', 'RGBA', 'L', 'LA', 'P'):
+        img = img.convert('RGBA')
+
+    buffer = io.BytesIO()
+    img.save(buffer, format=image_format, **SAVE_OPTIONS[image_format])
+
+    stem = os.path.splitext(os.path.basename(original_name or ''))[0] or 'image'
+    return ContentFile(buffer.getvalue(), name=f'{stem}.{extension}')
+
+
+def process_image_upload(uploaded_file, max_dimension=None):
+    """
+    업로드 이미지를 검증하고 정규화된 ContentFile 반환
+    - 실패 시 ImageUploadError (메시지는 그대로 사용자에게 표시 가능)
+    """
+    img, image_format, extension = decode_image_upload(uploaded_file, max_dimension)
+    return encode_image(img, image_format, extension, uploaded_file.name)
+
+
+def _get_executor():
+    """이미지 처리용 스레드 풀 (프로세스당 1개, fork 이후 첫 사용 시 생성)"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=getattr(settings, 'IMAGE_PROCESSING_WORKERS', 4),
+                    thread_name_prefix='image-upload',
+                )
+    return _executor
+
+
+def process_image_uploads(uploaded_files, task=process_image_upload):
+    """
+    여러 업로드 이미지를 스레드 풀에서 병렬 처리 (Pillow는 디코딩/인코딩 중 GIL 해제)
+    - 결과는 입력 순서대로 반환
+    - 하나라도 실패하면 첫 ImageUploadError를 그대로 전달
+    """
+    if len(uploaded_files) <= 1:
+        return [task(f) for f in uploaded_files]
+    return list(_get_executor().map(task, uploaded_files))
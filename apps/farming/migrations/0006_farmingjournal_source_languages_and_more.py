@@ -0,0 +1,23 @@
+# Generated by Django 6.0 on 2026-10-19 11:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('farming', '0005_farmingjournal_guest_nickname_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='farmingjournal',
+            name='source_languages',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name='farmingrequest',
+            name='source_languages',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
@@ -1,9 +1,13 @@
 from django.db import models
 from django.conf import settings
 
+from apps.translations.models import TranslatableModel
 
-class FarmingJournal(models.Model):
+
+class FarmingJournal(TranslatableModel):
     """농사 일지 - 본인이 한 농사 기록 공유"""
+    translatable_fields = ('title', 'content')
+
     author = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
@@ -90,8 +94,10 @@ class FarmingJournalLike(models.Model):
         return f"{self.user} ❤️ {self.journal.title}"
 
 
-class FarmingRequest(models.Model):
+class FarmingRequest(TranslatableModel):
     """농사 요청 - 도움 요청"""
+    translatable_fields = ('title', 'content')
+
     author = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
@@ -8,11 +8,13 @@ from django.utils.translation import gettext as _
 from django.views.decorators.http import require_POST
 
 from .models import FarmingJournal, FarmingRequest, FarmingParticipation, FarmingJournalLike
+from apps.core.uploads import process_image_upload, ImageUploadError
+from apps.translations.services import prefetch_translations
 
 
 def farming_home(request):
     """농사 게시판 메인 페이지"""
-    recent_journals = FarmingJournal.objects.all()[:5]
+    recent_journals = prefetch_translations(FarmingJournal.objects.all()[:5], ['title'])
     recent_requests = FarmingRequest.objects.filter(status='open')[:5]
     
     context = {
@@ -35,6 +37,7 @@ def journal_list(request):
     paginator = Paginator(journals, 12)
     page = request.GET.get('page', 1)
     journals = paginator.get_page(page)
+    journals.object_list = prefetch_translations(journals.object_list, ['title'])
     
     context = {
         'journals': journals,
@@ -90,7 +93,11 @@ def journal_create(request):
 
         # 이미지 처리
         if 'image' in request.FILES:
-            journal.image = request.FILES['image']
+            try:
+                journal.image = process_image_upload(request.FILES['image'])
+            except ImageUploadError as e:
+                messages.error(request, str(e))
+                return render(request, 'farming/journal_create.html', {})
 
         journal.save()
 
@@ -125,10 +132,12 @@ def journal_detail(request, pk):
         parent__isnull=True
     ).select_related('author').prefetch_related('replies')
     
+    prefetch_translations([journal], ['title', 'content'])
+
     context = {
         'journal': journal,
         'user_liked': user_liked,
-        'comments': comments,
+        'comments': prefetch_translations(comments, ['content']),
     }
     return render(request, 'farming/journal_detail.html', context)
 
@@ -173,10 +182,10 @@ def toggle_journal_like(request, pk):
     
     journal.save(update_fields=['like_count'])
     
-    # 작성자 랭킹 업데이트
-    if journal.author:
-        from apps.rankings.utils import update_user_ranking
-        update_user_ranking(journal.author)
+    # 작성자 랭킹 반영 (회원 좋아요만 집계 - 증감분만 적용)
+    if journal.author and request.user.is_authenticated:
+        from apps.rankings.utils import apply_ranking_delta
+        apply_ranking_delta(journal.author, occurred_at=like.created_at, farming_likes=1 if liked else -1)
     
     return JsonResponse({
         'liked': liked,
@@ -388,7 +397,11 @@ def journal_edit(request, pk):
             journal.longitude = lng
 
         if 'image' in request.FILES:
-            journal.image = request.FILES['image']
+            try:
+                journal.image = process_image_upload(request.FILES['image'])
+            except ImageUploadError as e:
+                messages.error(request, str(e))
+                return redirect('farming:journal_edit', pk=pk)
 
         journal.save()
         messages.success(request, _('농사 일지가 수정되었습니다.'))
@@ -71,16 +71,10 @@ def toggle_like(request, coordinate_id):
     
     coordinate.save(update_fields=['like_count'])
     
-    # 작성자 통계 및 랭킹 업데이트
-    if coordinate.author:
-        coordinate.author.total_likes_received = Like.objects.filter(
-            coordinate__author=coordinate.author
-        ).count()
-        coordinate.author.save(update_fields=['total_likes_received'])
-        
-        # 랭킹 동기화
-        from apps.rankings.utils import update_user_ranking
-        update_user_ranking(coordinate.author)
+    # 작성자 통계 및 랭킹 반영 (회원 좋아요만 집계 - 증감분만 적용)
+    if coordinate.author and request.user.is_authenticated:
+        from apps.rankings.utils import apply_ranking_delta
+        apply_ranking_delta(coordinate.author, occurred_at=like.created_at, likes=1 if liked else -1)
     
     return JsonResponse({
         'liked': liked,
@@ -0,0 +1,163 @@
+"""기간별 리더보드 - 점수 정렬 인덱스를 프로세스 메모리에 유지 (순위 조회 시 SQL 없음)
+
+- 기간마다 (-점수, 랭킹 ID) 정렬 리스트를 두고 bisect로 순위 계산
+  → recalculate_ranks의 ROW_NUMBER() 순서(점수 내림차순, 동점은 ID순)와 동일
+  순위 조회는 O(log n), 점수 변경은 리스트 중간 삭제/삽입이라 O(n) (연속 메모리 이동이라 수만 명 규모까지는 충분히 빠름)
+- 읽기/쓰기 모두 리더보드 잠금 안에서 수행 (갱신 중간 상태를 읽지 않도록)
+- 첫 사용 시(프로세스 시작 후) Ranking 테이블에서 생성
+- 이 프로세스의 점수 변경은 바로 반영 (apply_ranking_delta → update_scores)
+- 다른 워커의 변경은 순위 재계산에서 순위가 실제로 바뀐 경우에만 버전 토큰이 바뀌어 다시 생성
+- 버전이 그대로여도 LEADERBOARD_MAX_AGE초가 지나면 다시 생성 (캐시를 공유하지 않는 워커, 행 삭제 등 대비)
+"""
+import threading
+import time
+from bisect import bisect_left, insort
+
+from apps.core.cache_utils import get_version, bump_version
+
+from .models import Ranking
+
+LEADERBOARD_VERSION_KEY = 'rankings:leaderboard:version'
+LEADERBOARD_MAX_AGE = 300
+
+_boards = {}
+_boards_lock = threading.Lock()
+
+
+class Leaderboard:
+    """기간 1개의 점수 정렬 인덱스"""
+
+    def __init__(self, period_type, period_start, version):
+        self.period_type = period_type
+        self.period_start = period_start
+        self.version = version
+        self.loaded_at = time.monotonic()
+        self._keys = []     # (-score, ranking_id) 오름차순 = 점수 내림차순
+        self._entries = {}  # ranking_id → (user_id, score, approved_posts_count)
+        self._by_user = {}  # user_id → ranking_id
+        self._lock = threading.RLock()
+
+    def load(self, rows):
+        """(ranking_id, user_id, score, approved_posts_count) 목록으로 인덱스 생성"""
+        for ranking_id, user_id, score, posts in rows:
+            self._entries[ranking_id] = (user_id, score, posts)
+            self._by_user[user_id] = ranking_id
+        self._keys = sorted((-entry[1], ranking_id) for ranking_id, entry in self._entries.items())
+
+    def __len__(self):
+        with self._lock:
+            return len(self._keys)
+
+    def update(self, ranking_id, user_id, score, approved_posts_count):
+        """점수 변경 반영 (기존 위치 제거 후 새 위치에 삽입)"""
+        with self._lock:
+            old = self._entries.get(ranking_id)
+            if old is not None:
+                index = bisect_left(self._keys, (-old[1], ranking_id))
+                if index < len(self._keys) and self._keys[index] == (-old[1], ranking_id):
+                    del self._keys[index]
+            insort(self._keys, (-score, ranking_id))
+            self._entries[ranking_id] = (user_id, score, approved_posts_count)
+            self._by_user[user_id] = ranking_id
+
+    def rank_of(self, user_id):
+        """사용자 순위 (1부터, 랭킹에 없으면 None)"""
+        with self._lock:
+            ranking_id = self._by_user.get(user_id)
+            if ranking_id is None:
+                return None
+            score = self._entries[ranking_id][1]
+            return bisect_left(self._keys, (-score, ranking_id)) + 1
+
+    def top(self, limit, min_posts=0):
+        """상위 limit명의 (순위, 랭킹 ID) 목록 (승인된 글이 min_posts개 미만이면 제외)"""
+        result = []
+        with self._lock:
+            for index, (_, ranking_id) in enumerate(self._keys):
+                if len(result) >= limit:
+                    break
+                if self._entries[ranking_id][2] >= min_posts:
+                    result.append((index + 1, ranking_id))
+        return result
+
+    def top_user_ids(self, limit):
+        """상위 limit명의 사용자 ID 목록 (순위순)"""
+        with self._lock:
+            return [self._entries[ranking_id][0] for _, ranking_id in self._keys[:limit]]
+
+    def around(self, user_id, radius=2):
+        """사용자 앞뒤 radius명의 (순위, 랭킹 ID) 목록"""
+        with self._lock:
+            rank = self.rank_of(user_id)
+            if rank is None:
+                return []
+            start = max(0, rank - 1 - radius)
+            return [
+                (start + offset + 1, ranking_id)
+                for offset, (_, ranking_id) in enumerate(self._keys[start:rank + radius])
+            ]
+
+
+def _build(period_type, period_start, version):
+    board = Leaderboard(period_type, period_start, version)
+    board.load(
+        Ranking.objects.filter(period_type=period_type, period_start=period_start)
+        .values_list('id', 'user_id', 'score', 'approved_posts_count')
+    )
+    return board
+
+
+def _is_current(board, period_start, version):
+    return (
+        board is not None
+        and board.version == version
+        and board.period_start == period_start
+        and time.monotonic() - board.loaded_at < LEADERBOARD_MAX_AGE
+    )
+
+
+def get_leaderboard(period_type):
+    """현재 기간의 리더보드 (없거나 버전/기간이 바뀌었거나 오래됐으면 테이블에서 다시 생성)"""
+    from .utils import get_period_start
+
+    period_start = get_period_start(period_type)
+    version = get_version(LEADERBOARD_VERSION_KEY)
+
+    board = _boards.get(period_type)
+    if not _is_current(board, period_start, version):
+        with _boards_lock:
+            board = _boards.get(period_type)
+            if not _is_current(board, period_start, version):
+                board = _build(period_type, period_start, version)
+                _boards[period_type] = board
+    return board
+
+
+def update_scores(user_id, rows):
+    """
+    이 프로세스에 로드된 리더보드에 점수 변경 반영
+    - rows: (ranking_id, period_type, period_start, score, approved_posts_count) 목록
+    """
+    for ranking_id, period_type, period_start, score, posts in rows:
+        board = _boards.get(period_type)
+        if board is not None and board.period_start == period_start:
+            board.update(ranking_id, user_id, score, posts)
+
+
+def invalidate_leaderboards():
+    """모든 워커의 리더보드를 다음 조회 시 다시 생성하도록 버전 변경"""
+    bump_version(LEADERBOARD_VERSION_KEY)
+
+
+def top_rankings(period_type, limit=100, min_posts=1):
+    """리더보드 순서대로 상위 Ranking 객체 목록 (rank는 리더보드 기준 값으로 채움)"""
+    entries = get_leaderboard(period_type).top(limit, min_posts=min_posts)
+    rankings = Ranking.objects.select_related('user').in_bulk([ranking_id for _, ranking_id in entries])
+
+    result = []
+    for rank, ranking_id in entries:
+        ranking = rankings.get(ranking_id)
+        if ranking is not None:
+            ranking.rank = rank
+            result.append(ranking)
+    return result
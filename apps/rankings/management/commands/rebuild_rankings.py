@@ -0,0 +1,23 @@
+"""랭킹 전체 재구성 관리 명령어 - 점수 가중치(RANKING_SCORE) 변경 후 등에 사용
+
+사용법:
+    python manage.py rebuild_rankings
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.rankings.utils import rebuild_rankings
+
+
+class Command(BaseCommand):
+    help = '현재 기간(전체/주간/월간) 랭킹과 사용자 통계를 집계 쿼리로 한 번에 다시 계산합니다'
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        stats = rebuild_rankings()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"완료: 랭킹 {stats['updated']}개 수정, {stats['created']}개 생성, "
+            f"사용자 통계 {stats['users']}명 수정 ({time.monotonic() - started:.1f}초)"
+        ))
@@ -0,0 +1,54 @@
+"""랭킹 보정 관리 명령어 - 이벤트 단위 증감(apply_ranking_delta)으로 생긴 오차를 원본 데이터 기준으로 다시 계산
+
+사용법 (매일 새벽 cron 실행 권장):
+    python manage.py reconcile_rankings
+    python manage.py reconcile_rankings --user 42
+"""
+from django.core.management.base import BaseCommand
+from django.db.models import Count, Q
+
+from apps.accounts.models import CustomUser
+from apps.coordinates.models import Coordinate
+from apps.rankings.utils import update_user_ranking, recalculate_ranks, rebuild_rankings
+
+
+class Command(BaseCommand):
+    help = '랭킹 점수와 사용자 통계(작성 글 수, 받은 좋아요 수)를 원본 데이터로 다시 계산합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--user',
+            type=int,
+            help='특정 사용자 ID만 보정',
+        )
+
+    def handle(self, *args, **options):
+        if not options['user']:
+            # 전체 보정 - 집계 쿼리로 한 번에 재구성
+            stats = rebuild_rankings()
+            self.stdout.write(self.style.SUCCESS(
+                f"완료: 랭킹 {stats['updated']}개 수정, {stats['created']}개 생성, "
+                f"사용자 통계 {stats['users']}명 수정"
+            ))
+            return
+
+        user = CustomUser.objects.filter(pk=options['user']).annotate(
+            approved_posts=Count(
+                'coordinates',
+                filter=Q(coordinates__status=Coordinate.Status.APPROVED),
+                distinct=True,
+            ),
+            likes_received=Count('coordinates__likes', distinct=True),
+        ).first()
+        if user is None:
+            self.stderr.write(self.style.ERROR(f"사용자 {options['user']}을(를) 찾을 수 없습니다."))
+            return
+
+        update_user_ranking(user, recalculate=False)
+        CustomUser.objects.filter(pk=user.pk).update(
+            total_posts=user.approved_posts,
+            total_likes_received=user.likes_received,
+        )
+        recalculate_ranks()
+
+        self.stdout.write(self.style.SUCCESS(f"\n완료: {user} 랭킹/사용자 통계 재계산"))
@@ -0,0 +1,27 @@
+"""랭킹 기간 전환 관리 명령어 - 지난 주간/월간 랭킹을 보관하고 새 기간 랭킹을 미리 생성
+
+사용법 (매일 00:05 cron 실행 권장, 여러 번 실행해도 안전):
+    python manage.py rollover_rankings
+"""
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.rankings.models import Ranking
+from apps.rankings.utils import archive_finished_periods, open_current_period, recalculate_ranks
+
+
+class Command(BaseCommand):
+    help = '끝난 주간/월간 랭킹을 보관 테이블로 옮기고 새 기간 랭킹을 생성합니다'
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            for period_type in [Ranking.PeriodType.WEEKLY, Ranking.PeriodType.MONTHLY]:
+                archived, pruned = archive_finished_periods(period_type)
+                created = open_current_period(period_type)
+                self.stdout.write(
+                    f"{period_type}: 보관 {archived}개, 삭제 {pruned}개, 새 기간 생성 {created}개"
+                )
+
+        recalculate_ranks()
+
+        self.stdout.write(self.style.SUCCESS("\n완료"))
@@ -0,0 +1,39 @@
+# Generated by Django 6.0 on 2026-10-19 17:38
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rankings', '0004_remove_ranking_invalid_received_count_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RankingArchive',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period_type', models.CharField(choices=[('ALL', '전체'), ('WEEKLY', '주간'), ('MONTHLY', '월간')], max_length=10, verbose_name='기간 유형')),
+                ('period_start', models.DateField(verbose_name='기간 시작일')),
+                ('rank', models.PositiveIntegerField(verbose_name='순위')),
+                ('score', models.IntegerField(verbose_name='총 점수')),
+                ('approved_posts_count', models.PositiveIntegerField(default=0, verbose_name='승인된 글 수')),
+                ('likes_received_count', models.PositiveIntegerField(default=0, verbose_name='받은 좋아요 수')),
+                ('farming_likes_received_count', models.PositiveIntegerField(default=0, verbose_name='농사 일지 좋아요 수')),
+                ('copy_received_count', models.PositiveIntegerField(default=0, verbose_name='받은 복사 수')),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='ranking_archives', to=settings.AUTH_USER_MODEL, verbose_name='사용자')),
+            ],
+            options={
+                'verbose_name': '지난 랭킹',
+                'verbose_name_plural': '지난 랭킹들',
+                'ordering': ['period_type', '-period_start', 'rank'],
+                'indexes': [models.Index(fields=['period_type', 'period_start', 'rank'], name='rankings_ra_period__439eec_idx')],
+                'unique_together': {('user', 'period_type', 'period_start')},
+            },
+        ),
+    ]
@@ -54,19 +54,63 @@ class Ranking(models.Model):
     
     def calculate_score(self):
         """점수 계산"""
-        from django.conf import settings
-        
-        score_config = getattr(settings, 'RANKING_SCORE', {
-            'approved_post': 10,
-            'like_received': 5,
-            'farming_like': 10,
-            'copy_received': 2,
-        })
-        
-        self.score = (
-            self.approved_posts_count * score_config.get('approved_post', 10) +
-            self.likes_received_count * score_config.get('like_received', 5) +
-            self.farming_likes_received_count * score_config.get('farming_like', 10) +
-            self.copy_received_count * score_config.get('copy_received', 2)
+        self.score = sum(
+            getattr(self, field) * weight
+            for field, weight in get_score_weights().items()
         )
         return self.score
+
+
+class RankingArchive(models.Model):
+    """지난 주간/월간 랭킹 보관 (기간 종료 시 rollover_rankings가 생성, 이후 변경 없음)"""
+    
+    period_type = models.CharField(
+        _('기간 유형'),
+        max_length=10,
+        choices=Ranking.PeriodType.choices
+    )
+    period_start = models.DateField(_('기간 시작일'))
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='ranking_archives',
+        verbose_name=_('사용자')
+    )
+    
+    rank = models.PositiveIntegerField(_('순위'))
+    score = models.IntegerField(_('총 점수'))
+    approved_posts_count = models.PositiveIntegerField(_('승인된 글 수'), default=0)
+    likes_received_count = models.PositiveIntegerField(_('받은 좋아요 수'), default=0)
+    farming_likes_received_count = models.PositiveIntegerField(_('농사 일지 좋아요 수'), default=0)
+    copy_received_count = models.PositiveIntegerField(_('받은 복사 수'), default=0)
+    
+    archived_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        verbose_name = _('지난 랭킹')
+        verbose_name_plural = _('지난 랭킹들')
+        unique_together = ['user', 'period_type', 'period_start']
+        ordering = ['period_type', '-period_start', 'rank']
+        indexes = [
+            models.Index(fields=['period_type', 'period_start', 'rank']),
+        ]
+    
+    def __str__(self):
+        return f"{self.user.nickname} - {self.get_period_type_display()} {self.period_start} #{self.rank} ({self.score}점)"
+
+
+def get_score_weights():
+    """점수 구성 필드별 가중치 (settings.RANKING_SCORE 기준)"""
+    score_config = getattr(settings, 'RANKING_SCORE', {
+        'approved_post': 10,
+        'like_received': 5,
+        'farming_like': 10,
+        'copy_received': 2,
+    })
+    
+    return {
+        'approved_posts_count': score_config.get('approved_post', 10),
+        'likes_received_count': score_config.get('like_received', 5),
+        'farming_likes_received_count': score_config.get('farming_like', 10),
+        'copy_received_count': score_config.get('copy_received', 2),
+    }
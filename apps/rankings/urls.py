@@ -8,4 +8,6 @@ urlpatterns = [
     path('', views.ranking_list, name='list'),
     path('weekly/', views.weekly_ranking, name='weekly'),
     path('monthly/', views.monthly_ranking, name='monthly'),
+    path('weekly/previous/', views.previous_weekly_ranking, name='weekly_previous'),
+    path('monthly/previous/', views.previous_monthly_ranking, name='monthly_previous'),
 ]
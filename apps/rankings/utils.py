@@ -1,12 +1,46 @@
 """랭킹 유틸리티 함수"""
+import hashlib
+import logging
+import threading
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import F, Q
+from django.db.models.functions import Greatest
 from django.utils import timezone
 from datetime import timedelta, datetime
-from .models import Ranking
+from .models import Ranking, RankingArchive, get_score_weights
+from .leaderboard import update_scores, invalidate_leaderboards
+
+logger = logging.getLogger(__name__)
+
+# 순위 재계산 예약 플래그 (캐시 키)
+RECALC_PENDING_KEY = 'rankings:recalc:pending'
+
+# 랭킹 페이지 상위 목록 서명 (캐시 키) - 표시 내용이 바뀔 때만 값이 바뀜
+PAGE_SIGNATURE_KEY = 'rankings:page:signature:{}'
+PAGE_SIZE = 100
+
+# 이벤트 종류 → 랭킹 필드
+DELTA_FIELDS = {
+    'posts': 'approved_posts_count',
+    'likes': 'likes_received_count',
+    'farming_likes': 'farming_likes_received_count',
+    'copies': 'copy_received_count',
+}
+
+# 이벤트 종류 → 사용자 통계 필드
+USER_COUNTER_FIELDS = {
+    'posts': 'total_posts',
+    'likes': 'total_likes_received',
+}
 
 
 def get_period_start(period_type):
-    """기간 시작일 계산"""
-    today = timezone.now().date()
+    """기간 시작일 계산 (현지 날짜 기준)"""
+    today = timezone.localdate()
     
     if period_type == Ranking.PeriodType.WEEKLY:
         # 이번 주 월요일
@@ -20,8 +54,83 @@ def get_period_start(period_type):
         return datetime(2024, 1, 1).date()
 
 
-def update_user_ranking(user):
-    """사용자 랭킹 업데이트 (기간당 2개 쿼리로 최적화)"""
+def get_previous_period_start(period_type):
+    """직전 기간(지난주/지난달) 시작일"""
+    current_start = get_period_start(period_type)
+    if period_type == Ranking.PeriodType.WEEKLY:
+        return current_start - timedelta(days=7)
+    return (current_start - timedelta(days=1)).replace(day=1)
+
+
+def get_period_start_datetime(period_type):
+    """기간 시작 시각 (현지 시간 자정)"""
+    return timezone.make_aware(datetime.combine(get_period_start(period_type), datetime.min.time()))
+
+
+def apply_ranking_delta(user, occurred_at=None, posts=0, likes=0, farming_likes=0, copies=0):
+    """
+    이벤트 1건의 증감분을 랭킹/사용자 통계에 바로 반영 (사용자 이력과 무관하게 쿼리 수 고정)
+    - occurred_at: 점수 기준 시각 (글 승인 시각, 좋아요 생성 시각 등).
+      이번 주/이번 달 이전이면 전체 랭킹에만 반영
+    - 점수는 갱신 후의 구성 필드 값으로 다시 계산 (UPDATE 1개)
+    - 누락/오차는 reconcile_rankings 명령어가 주기적으로 보정
+    """
+    if not user:
+        return
+
+    event_deltas = {'posts': posts, 'likes': likes, 'farming_likes': farming_likes, 'copies': copies}
+    deltas = {DELTA_FIELDS[key]: delta for key, delta in event_deltas.items() if delta}
+    if not deltas:
+        return
+
+    if occurred_at is None:
+        occurred_at = timezone.now()
+
+    period_starts = {Ranking.PeriodType.ALL: get_period_start(Ranking.PeriodType.ALL)}
+    for period_type in [Ranking.PeriodType.WEEKLY, Ranking.PeriodType.MONTHLY]:
+        if occurred_at >= get_period_start_datetime(period_type):
+            period_starts[period_type] = get_period_start(period_type)
+
+    # 구성 필드는 0 미만으로 내려가지 않게 하고, 점수는 갱신될 값으로 계산
+    # (UPDATE의 SET 절에서 참조하는 컬럼은 갱신 전 값)
+    new_values = {
+        field: Greatest(F(field) + deltas[field], 0) if field in deltas else F(field)
+        for field in DELTA_FIELDS.values()
+    }
+    updates = {field: new_values[field] for field in deltas}
+    updates['score'] = sum(new_values[field] * weight for field, weight in get_score_weights().items())
+    updates['updated_at'] = timezone.now()
+
+    condition = Q()
+    for period_type, period_start in period_starts.items():
+        condition |= Q(period_type=period_type, period_start=period_start)
+
+    updated = Ranking.objects.filter(condition, user=user).update(**updates)
+    if updated < len(period_starts):
+        # 이번 기간 랭킹 행이 아직 없으면 (새 주/달, 첫 활동) 해당 사용자만 전체 재계산
+        # - 이벤트는 이미 DB에 반영된 상태이므로 재계산 결과에 포함됨
+        update_user_ranking(user, recalculate=False)
+
+    # 이 프로세스의 리더보드에 새 점수 반영
+    update_scores(user.pk, Ranking.objects.filter(condition, user=user).values_list(
+        'id', 'period_type', 'period_start', 'score', 'approved_posts_count'
+    ))
+
+    # 사용자 통계 (작성 글 수, 받은 좋아요 수)
+    user_updates = {
+        counter: Greatest(F(counter) + event_deltas[key], 0)
+        for key, counter in USER_COUNTER_FIELDS.items()
+        if event_deltas[key]
+    }
+    if user_updates:
+        # request.user(SimpleLazyObject)가 넘어올 수 있으므로 type(user) 대신 사용자 모델 사용
+        get_user_model().objects.filter(pk=user.pk).update(**user_updates)
+
+    schedule_rank_recalculation()
+
+
+def update_user_ranking(user, recalculate=True):
+    """사용자 랭킹 전체 재계산 (이벤트 단위 반영은 apply_ranking_delta, 이 함수는 보정용)"""
     from apps.coordinates.models import Coordinate
     from apps.interactions.models import Like
     from apps.farming.models import FarmingJournalLike
@@ -76,20 +185,249 @@ def update_user_ranking(user):
         ])
     
     # 순위 재계산
-    recalculate_ranks()
+    if recalculate:
+        recalculate_ranks()
 
 
 def recalculate_ranks():
-    """전체 순위 재계산"""
+    """
+    전체 순위 재계산 - 기간별 UPDATE 1개 (점수 내림차순 ROW_NUMBER, 동점은 먼저 생성된 순)
+    - 순위가 바뀐 행만 갱신
+    - UPDATE ... FROM 구문 사용 (PostgreSQL, SQLite 3.33+)
+    - 순위가 바뀐 행이 있을 때만 다른 워커의 리더보드 무효화
+    """
+    table = connection.ops.quote_name(Ranking._meta.db_table)
+    sql = f"""
+        UPDATE {table}
+        SET rank = ordered.new_rank
+        FROM (
+            SELECT id, ROW_NUMBER() OVER (ORDER BY score DESC, id) AS new_rank
+            FROM {table}
+            WHERE period_type = %s AND period_start = %s
+        ) AS ordered
+        WHERE {table}.id = ordered.id AND {table}.rank <> ordered.new_rank
+    """
+
+    changed = 0
+    with transaction.atomic(), connection.cursor() as cursor:
+        for period_type in [Ranking.PeriodType.ALL, Ranking.PeriodType.WEEKLY, Ranking.PeriodType.MONTHLY]:
+            cursor.execute(sql, [period_type, get_period_start(period_type)])
+            changed += max(cursor.rowcount, 0)
+
+    # 순서가 바뀌었을 때만 다른 워커의 리더보드를 다시 생성 (점수만 바뀐 경우 순서는 그대로)
+    if changed:
+        transaction.on_commit(invalidate_leaderboards)
+    # 랭킹 페이지 캐시 서명 갱신 (표시되는 점수가 바뀌었을 수 있음)
+    transaction.on_commit(refresh_page_signatures)
+
+
+def _compute_page_signature(period_type):
+    """랭킹 페이지 상위 100명의 표시 내용(순서, 점수, 구성 값) 해시"""
+    rows = Ranking.objects.filter(
+        period_type=period_type,
+        period_start=get_period_start(period_type),
+        approved_posts_count__gt=0
+    ).order_by('rank').values_list('user_id', 'score', *DELTA_FIELDS.values())[:PAGE_SIZE]
+    return hashlib.sha1(repr(list(rows)).encode()).hexdigest()[:16]
+
+
+def get_page_signature(period_type):
+    """랭킹 페이지 캐시 키에 쓰는 서명 (없으면 계산 후 저장)"""
+    key = PAGE_SIGNATURE_KEY.format(period_type)
+    signature = cache.get(key)
+    if signature is None:
+        signature = _compute_page_signature(period_type)
+        cache.set(key, signature, None)
+    return signature
+
+
+def refresh_page_signatures():
+    """
+    순위 재계산 후 기간별 서명 갱신
+    - 상위 100명의 구성/순서/점수가 그대로면 서명도 그대로 → 페이지 캐시 유지
+    """
     for period_type in [Ranking.PeriodType.ALL, Ranking.PeriodType.WEEKLY, Ranking.PeriodType.MONTHLY]:
-        period_start = get_period_start(period_type)
-        
-        rankings = Ranking.objects.filter(
-            period_type=period_type,
-            period_start=period_start
-        ).order_by('-score')
-        
-        for idx, ranking in enumerate(rankings, start=1):
-            if ranking.rank != idx:
-                ranking.rank = idx
-                ranking.save(update_fields=['rank'])
+        cache.set(PAGE_SIGNATURE_KEY.format(period_type), _compute_page_signature(period_type), None)
+
+
+def schedule_rank_recalculation():
+    """
+    순위 재계산 예약 (디바운스)
+    - RANKING_RECALC_DELAY초 안에 몰린 이벤트는 재계산 1번으로 처리
+    - 예약 여부는 캐시 플래그로 공유 (REDIS_URL 설정 시 워커 간에도 1번)
+    """
+    delay = getattr(settings, 'RANKING_RECALC_DELAY', 3)
+    if not cache.add(RECALC_PENDING_KEY, True, delay + 60):
+        return  # 이미 예약됨
+
+    def _run():
+        from django.db import close_old_connections
+
+        # 실행 중에 들어온 이벤트는 다음 재계산으로 예약되도록 먼저 해제
+        cache.delete(RECALC_PENDING_KEY)
+        try:
+            recalculate_ranks()
+        except Exception as e:
+            logger.error(f"순위 재계산 실패: {e}")
+        finally:
+            close_old_connections()
+
+    timer = threading.Timer(delay, _run)
+    timer.daemon = True
+    timer.start()
+
+
+def archive_finished_periods(period_type):
+    """
+    끝난 기간의 랭킹 행을 RankingArchive로 옮기고 삭제
+    - 순위는 종료 시점 점수로 확정 (점수 내림차순, 동점은 먼저 생성된 순)
+    - 점수와 승인된 글이 모두 0인 행은 보관하지 않음
+    - (보관된 행 수, 삭제된 행 수) 반환
+    """
+    current_start = get_period_start(period_type)
+    finished = Ranking.objects.filter(period_type=period_type, period_start__lt=current_start)
+
+    archived = 0
+    for period_start in finished.order_by().values_list('period_start', flat=True).distinct():
+        rows = Ranking.objects.filter(
+            period_type=period_type, period_start=period_start
+        ).order_by('-score', 'id').values_list(
+            'user_id', 'score', 'approved_posts_count', 'likes_received_count',
+            'farming_likes_received_count', 'copy_received_count',
+        )
+        archives = [
+            RankingArchive(
+                period_type=period_type,
+                period_start=period_start,
+                user_id=user_id,
+                rank=rank,
+                score=score,
+                approved_posts_count=posts,
+                likes_received_count=likes,
+                farming_likes_received_count=farming_likes,
+                copy_received_count=copies,
+            )
+            for rank, (user_id, score, posts, likes, farming_likes, copies) in enumerate(rows, start=1)
+            if score or posts
+        ]
+        RankingArchive.objects.bulk_create(archives, batch_size=500, ignore_conflicts=True)
+        archived += len(archives)
+
+    pruned, _ = finished.delete()
+    return archived, pruned
+
+
+def open_current_period(period_type):
+    """
+    현재 기간 랭킹 행을 미리 생성 (전체 랭킹에 있는 사용자 대상, 0점에서 시작)
+    - 기간 첫 이벤트가 apply_ranking_delta의 전체 재계산 경로를 타지 않도록 함
+    - 생성된 행 수 반환
+    """
+    period_start = get_period_start(period_type)
+    existing = set(
+        Ranking.objects.filter(period_type=period_type, period_start=period_start)
+        .values_list('user_id', flat=True)
+    )
+    user_ids = Ranking.objects.filter(
+        period_type=Ranking.PeriodType.ALL,
+        period_start=get_period_start(Ranking.PeriodType.ALL),
+    ).values_list('user_id', flat=True)
+
+    rankings = [
+        Ranking(user_id=user_id, period_type=period_type, period_start=period_start)
+        for user_id in user_ids
+        if user_id not in existing
+    ]
+    Ranking.objects.bulk_create(rankings, batch_size=500, ignore_conflicts=True)
+    return len(rankings)
+
+
+def rebuild_rankings():
+    """
+    현재 기간(전체/주간/월간) 랭킹을 원본 데이터로 한 번에 재구성
+    - 기간마다 GROUP BY 집계 쿼리 3개 (사용자 수와 무관)
+    - 점수 계산 후 bulk_update / bulk_create, 사용자 통계도 함께 갱신 (트랜잭션 1개)
+    - {'updated': 수정된 랭킹 행 수, 'created': 생성된 행 수, 'users': 수정된 사용자 수} 반환
+    """
+    from apps.accounts.models import CustomUser
+    from apps.coordinates.models import Coordinate
+    from apps.interactions.models import Like
+    from apps.farming.models import FarmingJournalLike
+    from django.db.models import Sum, Count
+
+    weights = get_score_weights()
+    fields = list(DELTA_FIELDS.values())
+    now = timezone.now()
+    stats = {'updated': 0, 'created': 0, 'users': 0}
+
+    with transaction.atomic():
+        for period_type in [Ranking.PeriodType.ALL, Ranking.PeriodType.WEEKLY, Ranking.PeriodType.MONTHLY]:
+            period_start = get_period_start(period_type)
+
+            coord_qs = Coordinate.objects.filter(status=Coordinate.Status.APPROVED, author__isnull=False)
+            like_qs = Like.objects.filter(coordinate__author__isnull=False)
+            farming_qs = FarmingJournalLike.objects.filter(journal__author__isnull=False)
+            if period_type != Ranking.PeriodType.ALL:
+                start_datetime = get_period_start_datetime(period_type)
+                coord_qs = coord_qs.filter(approved_at__gte=start_datetime)
+                like_qs = like_qs.filter(created_at__gte=start_datetime)
+                farming_qs = farming_qs.filter(created_at__gte=start_datetime)
+
+            # 사용자별 구성 필드 값 {user_id: {field: value}}
+            totals = {}
+
+            def _add(user_id, field, value):
+                totals.setdefault(user_id, dict.fromkeys(fields, 0))[field] = value or 0
+
+            for row in coord_qs.order_by().values('author_id').annotate(posts=Count('id'), copies=Sum('copy_count')):
+                _add(row['author_id'], 'approved_posts_count', row['posts'])
+                _add(row['author_id'], 'copy_received_count', row['copies'])
+            for row in like_qs.order_by().values('coordinate__author_id').annotate(count=Count('id')):
+                _add(row['coordinate__author_id'], 'likes_received_count', row['count'])
+            for row in farming_qs.order_by().values('journal__author_id').annotate(count=Count('id')):
+                _add(row['journal__author_id'], 'farming_likes_received_count', row['count'])
+
+            existing = {
+                ranking.user_id: ranking
+                for ranking in Ranking.objects.filter(period_type=period_type, period_start=period_start)
+            }
+
+            to_update, to_create = [], []
+            for user_id in existing.keys() | totals.keys():
+                values = totals.get(user_id) or dict.fromkeys(fields, 0)
+                score = sum(values[field] * weight for field, weight in weights.items())
+
+                ranking = existing.get(user_id)
+                if ranking is None:
+                    to_create.append(Ranking(
+                        user_id=user_id, period_type=period_type, period_start=period_start,
+                        score=score, **values
+                    ))
+                elif ranking.score != score or any(getattr(ranking, f) != v for f, v in values.items()):
+                    for field, value in values.items():
+                        setattr(ranking, field, value)
+                    ranking.score = score
+                    ranking.updated_at = now
+                    to_update.append(ranking)
+
+            Ranking.objects.bulk_update(to_update, fields + ['score', 'updated_at'], batch_size=500)
+            Ranking.objects.bulk_create(to_create, batch_size=500)
+            stats['updated'] += len(to_update)
+            stats['created'] += len(to_create)
+
+            # 사용자 통계 (작성 글 수, 받은 좋아요 수) - 전체 기간 집계 재사용
+            if period_type == Ranking.PeriodType.ALL:
+                users = []
+                for user in CustomUser.objects.filter(
+                    rankings__period_type=period_type, rankings__period_start=period_start
+                ).only('total_posts', 'total_likes_received'):
+                    values = totals.get(user.pk) or dict.fromkeys(fields, 0)
+                    posts, likes = values['approved_posts_count'], values['likes_received_count']
+                    if (user.total_posts, user.total_likes_received) != (posts, likes):
+                        user.total_posts, user.total_likes_received = posts, likes
+                        users.append(user)
+                CustomUser.objects.bulk_update(users, ['total_posts', 'total_likes_received'], batch_size=500)
+                stats['users'] = len(users)
+
+    recalculate_ranks()
+    return stats
@@ -1,10 +1,38 @@
 """Rankings views - 랭킹"""
+from django.conf import settings
+from django.core.cache import cache
 from django.shortcuts import render
-from django.utils import timezone
+from django.template.loader import render_to_string
+from django.utils.safestring import mark_safe
+from django.utils.translation import get_language
 from datetime import timedelta
 
-from .models import Ranking
-from .utils import get_period_start
+from .leaderboard import top_rankings
+from .models import Ranking, RankingArchive
+from .utils import get_period_start, get_previous_period_start, get_page_signature
+
+
+def _render_ranking_rows(cache_key, fetch_rankings):
+    """
+    랭킹 목록 HTML (언어별 캐시)
+    - 현재 기간: 키에 상위 100명 서명 포함 → 표시 내용이 바뀔 때만 새로 렌더링
+    - 닉네임/프로필 사진 변경은 RANKING_PAGE_CACHE_TIMEOUT 후 반영
+    """
+    key = f'rankings:page:{cache_key}:{(get_language() or "ko")[:2]}'
+    html = cache.get(key)
+    if html is None:
+        html = render_to_string('rankings/_ranking_rows.html', {'rankings': fetch_rankings()})
+        cache.set(key, str(html), getattr(settings, 'RANKING_PAGE_CACHE_TIMEOUT', 600))
+    return mark_safe(html)
+
+
+def _current_ranking_rows(period_type):
+    """현재 기간 랭킹 목록 - 리더보드 순서 (승인된 글이 있는 사용자만)"""
+    period_start = get_period_start(period_type)
+    return _render_ranking_rows(
+        f'{period_type}:{period_start:%Y%m%d}:{get_page_signature(period_type)}',
+        lambda: top_rankings(period_type, limit=100),
+    )
 
 
 def ranking_list(request):
@@ -16,16 +44,8 @@ def ranking_list(request):
     elif period_type == 'MONTHLY':
         return monthly_ranking(request)
     
-    # 전체 랭킹 - utils의 get_period_start 사용
-    period_start = get_period_start(Ranking.PeriodType.ALL)
-    rankings = Ranking.objects.filter(
-        period_type=Ranking.PeriodType.ALL,
-        period_start=period_start,
-        approved_posts_count__gt=0
-    ).select_related('user').order_by('rank')[:100]
-    
     context = {
-        'rankings': rankings,
+        'ranking_rows': _current_ranking_rows(Ranking.PeriodType.ALL),
         'period_type': 'ALL',
         'period_label': '전체',
     }
@@ -34,18 +54,11 @@ def ranking_list(request):
 
 def weekly_ranking(request):
     """주간 랭킹"""
-    today = timezone.now().date()
     # 이번 주 월요일
-    week_start = today - timedelta(days=today.weekday())
-    
-    rankings = Ranking.objects.filter(
-        period_type=Ranking.PeriodType.WEEKLY,
-        period_start=week_start,
-        approved_posts_count__gt=0
-    ).select_related('user').order_by('rank')[:100]
+    week_start = get_period_start(Ranking.PeriodType.WEEKLY)
     
     context = {
-        'rankings': rankings,
+        'ranking_rows': _current_ranking_rows(Ranking.PeriodType.WEEKLY),
         'period_type': 'WEEKLY',
         'period_label': f'주간 ({week_start.strftime("%m/%d")} ~ )',
     }
@@ -54,18 +67,50 @@ def weekly_ranking(request):
 
 def monthly_ranking(request):
     """월간 랭킹"""
-    today = timezone.now().date()
-    month_start = today.replace(day=1)
-    
-    rankings = Ranking.objects.filter(
-        period_type=Ranking.PeriodType.MONTHLY,
-        period_start=month_start,
-        approved_posts_count__gt=0
-    ).select_related('user').order_by('rank')[:100]
+    month_start = get_period_start(Ranking.PeriodType.MONTHLY)
     
     context = {
-        'rankings': rankings,
+        'ranking_rows': _current_ranking_rows(Ranking.PeriodType.MONTHLY),
         'period_type': 'MONTHLY',
         'period_label': f'월간 ({month_start.strftime("%Y년 %m월")})',
     }
     return render(request, 'rankings/list.html', context)
+
+
+def _archived_ranking_rows(period_type, period_start):
+    """보관된 지난 기간 랭킹 상위 100명 (인덱스 1회 조회, 변경되지 않으므로 기간별 캐시)"""
+    return _render_ranking_rows(
+        f'archive:{period_type}:{period_start:%Y%m%d}',
+        lambda: RankingArchive.objects.filter(
+            period_type=period_type,
+            period_start=period_start,
+            approved_posts_count__gt=0
+        ).select_related('user').order_by('rank')[:100],
+    )
+
+
+def previous_weekly_ranking(request):
+    """지난주 랭킹 (보관 데이터)"""
+    week_start = get_previous_period_start(Ranking.PeriodType.WEEKLY)
+    week_end = week_start + timedelta(days=6)
+    
+    context = {
+        'ranking_rows': _archived_ranking_rows(Ranking.PeriodType.WEEKLY, week_start),
+        'period_type': 'WEEKLY',
+        'period_label': f'지난주 ({week_start.strftime("%m/%d")} ~ {week_end.strftime("%m/%d")})',
+        'is_previous': True,
+    }
+    return render(request, 'rankings/list.html', context)
+
+
+def previous_monthly_ranking(request):
+    """지난달 랭킹 (보관 데이터)"""
+    month_start = get_previous_period_start(Ranking.PeriodType.MONTHLY)
+    
+    context = {
+        'ranking_rows': _archived_ranking_rows(Ranking.PeriodType.MONTHLY, month_start),
+        'period_type': 'MONTHLY',
+        'period_label': f'지난달 ({month_start.strftime("%Y년 %m월")})',
+        'is_previous': True,
+    }
+    return render(request, 'rankings/list.html', context)
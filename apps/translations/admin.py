@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import ContentTranslation
+from .models import ContentTranslation, TranslationMemory, TranslationUsage, TranslationJob
 
 
 @admin.register(ContentTranslation)
@@ -8,3 +8,22 @@ class ContentTranslationAdmin(admin.ModelAdmin):
     list_filter = ['source_language', 'target_language', 'content_type']
     search_fields = ['translated_text']
     readonly_fields = ['created_at', 'updated_at']
+
+
+@admin.register(TranslationMemory)
+class TranslationMemoryAdmin(admin.ModelAdmin):
+    list_display = ['source_text', 'source_language', 'target_language', 'hit_count', 'created_at']
+    list_filter = ['source_language', 'target_language']
+    search_fields = ['source_text', 'translated_text']
+    readonly_fields = ['text_hash', 'created_at']
+
+
+@admin.register(TranslationUsage)
+class TranslationUsageAdmin(admin.ModelAdmin):
+    list_display = ['date', 'characters', 'requests']
+
+
+@admin.register(TranslationJob)
+class TranslationJobAdmin(admin.ModelAdmin):
+    list_display = ['content_type', 'object_id', 'field_name', 'target_language', 'priority', 'created_at']
+    list_filter = ['priority', 'target_language', 'content_type']
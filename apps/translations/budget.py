@@ -0,0 +1,246 @@
+"""DeepL 글자 수 예산 - 사용량 집계 + 우선순위별 번역 허용/보류
+
+- DeepL 요청마다 보낸 원문 글자 수를 일별로 기록 (TranslationUsage)
+- 일/월 예산 대비 사용률이 올라갈수록 낮은 우선순위 번역부터 보류 (TranslationJob)
+  보류된 작업은 process_translation_jobs 명령어가 예산 안에서 우선순위 순으로 처리
+- 예산을 다 쓰면 DeepL 호출 중단 (call_deepl_api_batch)
+"""
+import logging
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Q, Sum
+from django.utils import timezone
+
+from .models import TranslationUsage, TranslationJob
+
+logger = logging.getLogger(__name__)
+
+# 우선순위 (낮을수록 먼저)
+PRIORITY_READER = 0   # 독자가 해당 언어로 보고 있음 - 예산이 남아 있으면 항상 번역
+PRIORITY_SHORT = 1    # 제목, 엽서 이름
+PRIORITY_BODY = 2     # 본문, 댓글
+PRIORITY_LONG = 3     # 긴 본문 (TRANSLATION_LONG_TEXT_CHARS자 초과)
+
+SHORT_FIELDS = ('title', 'postcard_name')
+
+# 예산 사용률별 즉시 번역할 최대 우선순위 (사용률이 이 값 이상이면 해당 우선순위까지만)
+PRIORITY_THRESHOLDS = [
+    (0.9, PRIORITY_READER),
+    (0.75, PRIORITY_SHORT),
+    (0.5, PRIORITY_BODY),
+]
+
+# 보류 작업 표시 (캐시) - 표시가 있는 항목만 우선순위 올리기 시도 (렌더링마다 DB 쓰기 방지)
+JOB_MARKER_TIMEOUT = 60 * 60 * 24 * 31
+
+
+def _job_marker_key(content_type_id, object_id, field_name, target_lang):
+    return f'translations:job:{content_type_id}:{object_id}:{field_name}:{target_lang}'
+
+
+def text_priority(field_name, text):
+    """필드/길이 기준 우선순위"""
+    if field_name in SHORT_FIELDS:
+        return PRIORITY_SHORT
+    if len(text) > getattr(settings, 'TRANSLATION_LONG_TEXT_CHARS', 500):
+        return PRIORITY_LONG
+    return PRIORITY_BODY
+
+
+def record_usage(characters):
+    """DeepL 요청 1번의 원문 글자 수 기록"""
+    today = timezone.localdate()
+    updated = TranslationUsage.objects.filter(date=today).update(
+        characters=F('characters') + characters,
+        requests=F('requests') + 1,
+    )
+    if updated:
+        return
+    try:
+        with transaction.atomic():
+            TranslationUsage.objects.create(date=today, characters=characters, requests=1)
+    except IntegrityError:
+        # 다른 요청이 먼저 오늘 행을 만든 경우
+        TranslationUsage.objects.filter(date=today).update(
+            characters=F('characters') + characters,
+            requests=F('requests') + 1,
+        )
+
+
+def has_budget():
+    """일/월 예산 중 하나라도 설정되어 있는지 (없으면 사용량 조회 없이 항상 허용)"""
+    return bool(
+        getattr(settings, 'TRANSLATION_DAILY_CHAR_BUDGET', 0)
+        or getattr(settings, 'TRANSLATION_MONTHLY_CHAR_BUDGET', 0)
+    )
+
+
+def get_usage():
+    """오늘/이번 달 사용량과 예산 (예산 0은 제한 없음) - 쿼리 1번"""
+    today = timezone.localdate()
+    totals = TranslationUsage.objects.filter(
+        date__gte=today.replace(day=1), date__lte=today,
+    ).aggregate(
+        month_characters=Sum('characters'),
+        month_requests=Sum('requests'),
+        today_characters=Sum('characters', filter=Q(date=today)),
+        today_requests=Sum('requests', filter=Q(date=today)),
+    )
+
+    daily_budget = getattr(settings, 'TRANSLATION_DAILY_CHAR_BUDGET', 0)
+    monthly_budget = getattr(settings, 'TRANSLATION_MONTHLY_CHAR_BUDGET', 0)
+    today_chars = totals['today_characters'] or 0
+    month_chars = totals['month_characters'] or 0
+
+    ratios = []
+    if daily_budget:
+        ratios.append(today_chars / daily_budget)
+    if monthly_budget:
+        ratios.append(month_chars / monthly_budget)
+
+    return {
+        'today_characters': today_chars,
+        'today_requests': totals['today_requests'] or 0,
+        'month_characters': month_chars,
+        'month_requests': totals['month_requests'] or 0,
+        'daily_budget': daily_budget,
+        'monthly_budget': monthly_budget,
+        'usage_ratio': round(max(ratios), 3) if ratios else 0,
+    }
+
+
+def remaining_characters(usage=None):
+    """오늘 더 보낼 수 있는 글자 수 (제한 없으면 None) - usage를 넘기면 다시 조회하지 않음"""
+    if not has_budget():
+        return None
+    usage = usage or get_usage()
+    remaining = []
+    if usage['daily_budget']:
+        remaining.append(usage['daily_budget'] - usage['today_characters'])
+    if usage['monthly_budget']:
+        remaining.append(usage['monthly_budget'] - usage['month_characters'])
+    return max(0, min(remaining)) if remaining else None
+
+
+def allowed_priority(usage=None):
+    """지금 바로 번역할 수 있는 최대 우선순위 (예산을 다 썼으면 None) - usage를 넘기면 다시 조회하지 않음"""
+    if not has_budget():
+        return PRIORITY_LONG
+    ratio = (usage or get_usage())['usage_ratio']
+    if ratio >= 1:
+        return None
+    for threshold, priority in PRIORITY_THRESHOLDS:
+        if ratio >= threshold:
+            return priority
+    return PRIORITY_LONG
+
+
+class CharacterAllowance:
+    """
+    작업 1번(요청 1번, 배치 1번)에서 보낼 수 있는 글자 수
+    - 사용량은 처음 필요할 때 1번만 조회하고 이후에는 보낸 만큼 로컬에서 차감
+    - 동시에 도는 다른 작업과의 차이는 다음 작업의 조회 때 반영됨
+    """
+
+    _UNSET = object()
+
+    def __init__(self, usage=None):
+        self._remaining = remaining_characters(usage) if usage is not None else self._UNSET
+
+    def take(self, characters):
+        """characters자를 보내도 되면 차감 후 True, 예산을 넘으면 False"""
+        if self._remaining is self._UNSET:
+            self._remaining = remaining_characters()
+        if self._remaining is None:
+            return True
+        if characters > self._remaining:
+            logger.warning(f"DeepL character budget exhausted ({characters} > {self._remaining})")
+            return False
+        self._remaining -= characters
+        return True
+
+
+def enqueue_jobs(items):
+    """(객체, 필드, 타겟 언어, 우선순위) 목록을 보류 작업으로 저장 (이미 있으면 그대로) + 캐시에 보류 표시"""
+    jobs = [
+        TranslationJob(
+            content_type=ContentType.objects.get_for_model(obj),
+            object_id=obj.pk,
+            field_name=field,
+            target_language=target,
+            priority=priority,
+        )
+        for obj, field, target, priority in items
+    ]
+    TranslationJob.objects.bulk_create(jobs, ignore_conflicts=True)
+    cache.set_many(
+        {
+            _job_marker_key(job.content_type.pk, job.object_id, job.field_name, job.target_language): 1
+            for job in jobs
+            if job.priority > PRIORITY_READER
+        },
+        JOB_MARKER_TIMEOUT,
+    )
+
+
+def promote_job(obj, field_name, target_lang):
+    """
+    보류된 번역을 독자가 보고 있으면 가장 높은 우선순위로 (인기 글이 대기열에서 밀리지 않도록)
+    - 보류 표시가 있는 항목만 1번 처리 (보류 작업이 없으면 캐시 조회 1번으로 끝)
+    """
+    ct = ContentType.objects.get_for_model(obj)
+    marker_key = _job_marker_key(ct.pk, obj.pk, field_name, target_lang)
+    if cache.get(marker_key) is None or not cache.delete(marker_key):
+        return
+    TranslationJob.objects.filter(
+        content_type=ct,
+        object_id=obj.pk,
+        field_name=field_name,
+        target_language=target_lang,
+        priority__gt=PRIORITY_READER,
+    ).update(priority=PRIORITY_READER)
+
+
+def process_jobs(limit=200):
+    """
+    보류 작업을 우선순위 → 등록 순으로 처리 (현재 예산에서 허용되는 우선순위까지)
+    - 번역됐거나 더 번역할 필요가 없는 작업은 삭제, DeepL 실패한 작업은 남겨 둠
+    - 처리한 작업 수 반환
+    """
+    from .services import translate_items
+
+    usage = get_usage() if has_budget() else None
+    max_priority = allowed_priority(usage)
+    if max_priority is None:
+        return 0
+
+    jobs = list(
+        TranslationJob.objects.filter(priority__lte=max_priority)
+        .select_related('content_type')
+        .order_by('priority', 'created_at')[:limit]
+    )
+    if not jobs:
+        return 0
+
+    items = {
+        (job.content_type.model_class(), job.object_id, job.field_name, job.target_language): job
+        for job in jobs
+    }
+    resolved = [items[key] for key in translate_items(list(items), allowance=CharacterAllowance(usage))]
+    TranslationJob.objects.filter(pk__in=[job.pk for job in resolved]).delete()
+    cache.delete_many([
+        _job_marker_key(job.content_type_id, job.object_id, job.field_name, job.target_language)
+        for job in resolved
+    ])
+    return len(resolved)
+
+
+def queue_status():
+    """우선순위별 보류 작업 수"""
+    return {
+        str(row['priority']): row['count']
+        for row in TranslationJob.objects.values('priority').annotate(count=Count('id')).order_by('priority')
+    }
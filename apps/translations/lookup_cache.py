@@ -0,0 +1,131 @@
+"""번역 조회 캐시 - 프로세스 내 LRU(TTL) → Django 캐시 → ContentTranslation 테이블 순서로 조회
+
+- 키: (content type ID, object ID, 필드, 타겟 언어), 값: 번역문
+- 번역이 없다는 결과('')는 공유 캐시에만 저장 (LRU에 두면 다른 워커가 저장한 번역이 TTL 동안 안 보임)
+- 번역 저장/삭제 시 invalidate → 이 프로세스의 LRU와 공유 캐시에서 제거
+- 다른 워커의 LRU는 TTL(settings.TRANSLATION_LRU_TTL) 안에 만료됨
+"""
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
+
+SHARED_TIMEOUT = 60 * 60 * 24
+
+
+class LRUCache:
+    """크기 제한 + TTL LRU (스레드 안전, 적중/미스 수 집계)"""
+
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()  # 키 → (만료 시각, 값)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                del self._data[key]
+            self.misses += 1
+            return None
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def __len__(self):
+        return len(self._data)
+
+
+_local = LRUCache(
+    maxsize=getattr(settings, 'TRANSLATION_LRU_SIZE', 10000),
+    ttl=getattr(settings, 'TRANSLATION_LRU_TTL', 60),
+)
+_stats_lock = threading.Lock()
+_shared_hits = 0
+_shared_misses = 0
+
+
+def _shared_key(key):
+    return 'translations:text:{}:{}:{}:{}'.format(*key)
+
+
+def _count_shared(hits, misses):
+    global _shared_hits, _shared_misses
+    with _stats_lock:
+        _shared_hits += hits
+        _shared_misses += misses
+
+
+def get_many(keys):
+    """{키: 번역문} - 캐시에 있는 것만, 번역이 없다고 기록된 키는 '' (캐시에 없는 키는 DB에서 조회 후 set_many)"""
+    found = {}
+    remaining = []
+    for key in keys:
+        value = _local.get(key)
+        if value is None:
+            remaining.append(key)
+        else:
+            found[key] = value
+    if not remaining:
+        return found
+
+    shared = cache.get_many([_shared_key(key) for key in remaining])
+    shared_hits = 0
+    for key in remaining:
+        value = shared.get(_shared_key(key))
+        if value is not None:
+            found[key] = value
+            if value:
+                _local.set(key, value)
+            shared_hits += 1
+    _count_shared(shared_hits, len(remaining) - shared_hits)
+    return found
+
+
+def get(key):
+    return get_many([key]).get(key)
+
+
+def set_many(values):
+    """{키: 번역문 또는 ''(번역 없음)} 저장 (LRU + 공유 캐시)"""
+    for key, value in values.items():
+        if value:
+            _local.set(key, value)
+    cache.set_many({_shared_key(key): value for key, value in values.items()}, SHARED_TIMEOUT)
+
+
+def invalidate(keys):
+    """번역 저장/삭제 시 호출"""
+    for key in keys:
+        _local.delete(key)
+    cache.delete_many([_shared_key(key) for key in keys])
+
+
+def stats():
+    """적중/미스 수 (현재 워커 프로세스 기준)"""
+    lookups = _local.hits + _local.misses
+    return {
+        'local_size': len(_local),
+        'local_hits': _local.hits,
+        'local_misses': _local.misses,
+        'shared_hits': _shared_hits,
+        'shared_misses': _shared_misses,
+        'hit_rate': round((_local.hits + _shared_hits) / lookups, 3) if lookups else None,
+    }
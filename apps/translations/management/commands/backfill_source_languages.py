@@ -0,0 +1,49 @@
+"""기존 게시글 원문 언어 채우기 관리 명령어 (source_languages 필드 추가 전에 작성된 글)
+
+사용법:
+    python manage.py backfill_source_languages
+    python manage.py backfill_source_languages --batch 1000
+"""
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+from apps.translations.models import TranslatableModel
+
+
+class Command(BaseCommand):
+    help = '원문 언어가 저장되지 않은 기존 게시글의 필드별 원문 언어를 감지해 저장합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch',
+            type=int,
+            default=500,
+            help='한 번에 저장할 객체 수 (기본: 500)',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch']
+
+        for Model in apps.get_models():
+            if not issubclass(Model, TranslatableModel):
+                continue
+
+            queryset = Model.objects.filter(source_languages={}).only('pk', *Model.translatable_fields)
+            pending = []
+            updated = 0
+            for obj in queryset.iterator(chunk_size=batch_size):
+                obj.update_source_languages()
+                if not obj.source_languages:
+                    continue  # 번역 대상 필드가 모두 비어 있음
+                pending.append(obj)
+                if len(pending) >= batch_size:
+                    Model.objects.bulk_update(pending, ['source_languages'])
+                    updated += len(pending)
+                    pending = []
+            if pending:
+                Model.objects.bulk_update(pending, ['source_languages'])
+                updated += len(pending)
+
+            self.stdout.write(f"  {Model._meta.label}: {updated}개")
+
+        self.stdout.write(self.style.SUCCESS("\n완료"))
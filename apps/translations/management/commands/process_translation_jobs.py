@@ -0,0 +1,29 @@
+"""보류된 번역 작업 처리 관리 명령어 - 글자 수 예산 안에서 우선순위 순으로 번역
+
+사용법 (5분마다 cron 실행 권장):
+    python manage.py process_translation_jobs
+    python manage.py process_translation_jobs --limit 500
+"""
+from django.core.management.base import BaseCommand
+
+from apps.translations.budget import process_jobs, get_usage, queue_status
+
+
+class Command(BaseCommand):
+    help = '예산 때문에 미룬 번역을 우선순위 순으로 처리합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--limit',
+            type=int,
+            default=200,
+            help='이번 실행에서 처리할 최대 작업 수 (기본: 200)',
+        )
+
+    def handle(self, *args, **options):
+        processed = process_jobs(limit=options['limit'])
+        usage = get_usage()
+        self.stdout.write(self.style.SUCCESS(
+            f"완료: {processed}개 처리, 남은 작업 {queue_status()}, "
+            f"이번 달 사용량 {usage['month_characters']}/{usage['monthly_budget'] or '∞'}자"
+        ))
@@ -1,22 +1,33 @@
 """기존 게시글 일괄 번역 관리 명령어
 
+- (객체, 필드, 타겟 언어) 단위로 빠진 번역만 요청
+- 워커 여러 개가 동시에 처리하고, DeepL 요청은 토큰 버킷으로 초당 --rate번 이하로 제한
+- 처리한 위치(pk)를 체크포인트 파일에 기록 → 중단 후 다시 실행하면 이어서 처리
+  (체크포인트는 번역 필드 목록과 함께 저장 - 필드 목록이 다르면 처음부터 처리)
+
 사용법:
-    python manage.py translate_existing --model coordinates.Coordinate --fields title,description,postcard_name --batch 50
-    python manage.py translate_existing --model comments.Comment --fields content --batch 50
+    python manage.py translate_existing --model coordinates.Coordinate --batch 50
+    python manage.py translate_existing --model comments.Comment --all --workers 4 --rate 5
     python manage.py translate_existing --model farming.FarmingJournal --fields title,content --batch 50
+    python manage.py translate_existing --model comments.Comment --all --restart   # 체크포인트 무시
 """
-import time
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
-from django.core.management.base import BaseCommand
 from django.apps import apps
+from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
 
+from apps.core.http import get_upstream
 from apps.translations.models import ContentTranslation
-from apps.translations.services import translate_on_create, SUPPORTED_LANGS
+from apps.translations.services import translate_objects, get_source_language, SUPPORTED_LANGS
 
 
 class Command(BaseCommand):
-    help = '기존 게시글을 일괄 번역합니다'
+    help = '기존 게시글을 일괄 번역합니다 (빠진 번역만, 동시 처리, 중단 후 이어서 처리)'
 
     def add_arguments(self, parser):
         parser.add_argument(
@@ -26,20 +37,45 @@ class Command(BaseCommand):
         )
         parser.add_argument(
             '--fields',
-            required=True,
-            help='번역할 필드 목록 (쉼표 구분, 예: title,description)',
+            help='번역할 필드 목록 (쉼표 구분, 기본: 모델의 translatable_fields)',
         )
         parser.add_argument(
             '--batch',
             type=int,
             default=50,
-            help='배치 크기 (기본: 50)',
+            help='이번 실행에서 처리할 객체 수 (기본: 50)',
+        )
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='남은 객체 모두 처리 (--batch 무시)',
+        )
+        parser.add_argument(
+            '--chunk',
+            type=int,
+            default=25,
+            help='DeepL 요청 1번에 묶을 객체 수 (기본: 25)',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=4,
+            help='동시 처리 워커 수 (기본: 4)',
+        )
+        parser.add_argument(
+            '--rate',
+            type=float,
+            default=2.0,
+            help='DeepL 초당 최대 요청 수 - 요금제 한도에 맞춤 (기본: 2)',
+        )
+        parser.add_argument(
+            '--restart',
+            action='store_true',
+            help='체크포인트를 무시하고 처음부터 처리',
         )
 
     def handle(self, *args, **options):
         model_label = options['model']
-        fields = options['fields'].split(',')
-        batch_size = options['batch']
 
         try:
             Model = apps.get_model(model_label)
@@ -47,29 +83,139 @@ class Command(BaseCommand):
             self.stderr.write(self.style.ERROR(f"모델 '{model_label}'을 찾을 수 없습니다."))
             return
 
-        ct = ContentType.objects.get_for_model(Model)
+        if options['fields']:
+            fields = options['fields'].split(',')
+        else:
+            fields = list(getattr(Model, 'translatable_fields', ()))
+        if not fields:
+            self.stderr.write(self.style.ERROR("번역할 필드를 --fields로 지정하세요."))
+            return
+
+        self.ct = ContentType.objects.get_for_model(Model)
+        self.fields = fields
 
-        # 번역이 없는 객체 찾기 - 첫 번째 필드와 첫 번째 타겟 언어 기준
-        already_translated_ids = ContentTranslation.objects.filter(
-            content_type=ct,
-            field_name=fields[0],
-        ).values_list('object_id', flat=True).distinct()
+        checkpoint_path = os.path.join(settings.BASE_DIR, f'.translate_existing.{Model._meta.label_lower}.json')
+        last_pk = 0
+        if not options['restart']:
+            last_pk = self._load_checkpoint(checkpoint_path, fields)
 
-        queryset = Model.objects.exclude(pk__in=already_translated_ids)
+        queryset = Model.objects.filter(pk__gt=last_pk).order_by('pk')
+        if not options['all']:
+            queryset = queryset[:options['batch']]
         total = queryset.count()
+        self.stdout.write(f"번역 대상: {total}개 ({model_label}, pk > {last_pk})")
+
+        # 모든 워커가 같은 토큰 버킷 공유
+        get_upstream('deepl').set_rate_limit(options['rate'], burst=options['workers'])
+
+        chunk_size = options['chunk']
+        max_in_flight = options['workers'] * 2
+        pending = {}          # future → 순번
+        finished = {}         # 순번 → (마지막 pk, 성공 여부 - 예외/DeepL 실패가 없으면 성공)
+        next_seq = 0          # 체크포인트에 반영할 다음 순번
+        seq = 0
+        processed = saved = failed = 0
+        checkpoint_blocked = False
+
+        def collect(done):
+            nonlocal processed, saved, failed, next_seq, checkpoint_blocked
+            for future in done:
+                chunk_seq = pending.pop(future)
+                max_pk, count, failed_count, needed, size, ok = future.result()
+                processed += size
+                saved += count
+                failed += failed_count
+                finished[chunk_seq] = (max_pk, ok)
+                self.stdout.write(f"  [{processed}/{total}] pk {max_pk} 까지 - 번역 {count}/{needed}")
+
+            # 앞쪽 청크가 모두 성공한 지점까지만 체크포인트 이동 (실패 청크는 다음 실행에서 재시도)
+            while not checkpoint_blocked and next_seq in finished:
+                max_pk, ok = finished.pop(next_seq)
+                if not ok:
+                    checkpoint_blocked = True
+                    break
+                self._save_checkpoint(checkpoint_path, max_pk)
+                next_seq += 1
+
+        with ThreadPoolExecutor(max_workers=options['workers'], thread_name_prefix='translate') as executor:
+            chunk = []
+            for obj in queryset.iterator(chunk_size=chunk_size * max_in_flight):
+                chunk.append(obj)
+                if len(chunk) < chunk_size:
+                    continue
+                if len(pending) >= max_in_flight:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+                pending[executor.submit(self._translate_chunk, chunk)] = seq
+                seq += 1
+                chunk = []
+            if chunk:
+                pending[executor.submit(self._translate_chunk, chunk)] = seq
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+
+        if failed or checkpoint_blocked:
+            self.stdout.write(self.style.WARNING(
+                f"\n완료: 번역 {saved}건 저장, {failed}건 실패 - 다시 실행하면 실패한 부분부터 이어서 처리"
+            ))
+        else:
+            self.stdout.write(self.style.SUCCESS(
+                f"\n완료: 객체 {processed}개, 번역 {saved}건 저장 (전체 {total}개 중)"
+            ))
+
+    def _translate_chunk(self, objs):
+        """
+        워커 작업 - 청크의 빠진 (객체, 필드, 타겟 언어)만 번역
+        (마지막 pk, 저장 수, 실패 수, 필요 수, 객체 수, 성공 여부) 반환
+        - 예외나 DeepL 실패(None)가 있을 때만 실패 (빈 번역은 성공으로 보고 다음 실행에서 다시 요청하지 않음)
+        """
+        existing = set()
+        try:
+            existing = set(
+                ContentTranslation.objects.filter(
+                    content_type=self.ct,
+                    object_id__in=[obj.pk for obj in objs],
+                    field_name__in=self.fields,
+                ).values_list('object_id', 'field_name', 'target_language')
+            )
+            needed = self._count_needed(objs, existing)
+            count, failed_count = translate_objects(objs, self.fields, skip=existing) if needed else (0, 0)
+            return objs[-1].pk, count, failed_count, needed, len(objs), not failed_count
+        except Exception as e:
+            self.stderr.write(f"  오류: pk {objs[0].pk} ~ {objs[-1].pk} - {e}")
+            needed = self._count_needed(objs, existing)
+            return objs[-1].pk, 0, needed, needed, len(objs), False
+        finally:
+            close_old_connections()
+
+    def _count_needed(self, objs, existing):
+        """번역이 필요한 (객체, 필드, 타겟 언어) 수"""
+        needed = 0
+        for obj in objs:
+            for field in self.fields:
+                if getattr(obj, field, ''):
+                    source_lang = get_source_language(obj, field)
+                    needed += sum(
+                        1 for target in SUPPORTED_LANGS
+                        if target != source_lang and (obj.pk, field, target) not in existing
+                    )
+        return needed
+
+    def _load_checkpoint(self, path, fields):
+        """마지막으로 처리한 pk (체크포인트가 없거나 다른 필드 목록으로 만든 것이면 0)"""
+        try:
+            with open(path) as f:
+                checkpoint = json.load(f)
+        except (OSError, ValueError):
+            return 0
+        if sorted(checkpoint.get('fields', [])) != sorted(fields):
+            self.stdout.write(f"필드 목록이 체크포인트({', '.join(checkpoint.get('fields', []))})와 달라 처음부터 처리합니다.")
+            return 0
+        return checkpoint.get('last_pk', 0)
 
-        self.stdout.write(f"번역 대상: {total}개 ({model_label})")
-
-        translated = 0
-        for obj in queryset[:batch_size]:
-            try:
-                translate_on_create(obj, fields)
-                translated += 1
-                self.stdout.write(f"  [{translated}/{min(total, batch_size)}] {obj} 번역 완료")
-                time.sleep(0.5)  # API 속도 제한 방지
-            except Exception as e:
-                self.stderr.write(f"  오류: {obj} - {e}")
-
-        self.stdout.write(self.style.SUCCESS(
-            f"\n완료: {translated}개 번역됨 (전체 {total}개 중 배치 {batch_size}개)"
-        ))
+    def _save_checkpoint(self, path, last_pk):
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump({'last_pk': last_pk, 'fields': self.fields}, f)
+        os.replace(tmp_path, path)
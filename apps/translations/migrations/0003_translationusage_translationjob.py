@@ -0,0 +1,47 @@
+# Generated by Django 6.0 on 2026-10-19 14:37
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('translations', '0002_translationmemory'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TranslationUsage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(unique=True)),
+                ('characters', models.PositiveBigIntegerField(default=0)),
+                ('requests', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': '번역 사용량',
+                'verbose_name_plural': '번역 사용량',
+                'ordering': ['-date'],
+            },
+        ),
+        migrations.CreateModel(
+            name='TranslationJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('object_id', models.PositiveIntegerField()),
+                ('field_name', models.CharField(max_length=50)),
+                ('target_language', models.CharField(max_length=5)),
+                ('priority', models.PositiveSmallIntegerField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('content_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='contenttypes.contenttype')),
+            ],
+            options={
+                'verbose_name': '번역 대기 작업',
+                'verbose_name_plural': '번역 대기 작업',
+                'indexes': [models.Index(fields=['priority', 'created_at'], name='translation_priorit_f6ad70_idx')],
+                'unique_together': {('content_type', 'object_id', 'field_name', 'target_language')},
+            },
+        ),
+    ]
@@ -3,6 +3,41 @@ from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 
 
+class TranslatableModel(models.Model):
+    """
+    자동 번역 대상 모델 공통 - 저장 시 필드별 원문 언어를 감지해 보관
+    → 렌더링 시 번역 조회에서 텍스트를 다시 훑지 않음
+    """
+    # 번역 대상 필드 (하위 모델에서 지정, 첫 번째 필드 언어가 게시글 원문 언어)
+    translatable_fields = ()
+
+    # {필드명: 원문 언어} - 비어 있는 필드는 없음
+    source_languages = models.JSONField(default=dict, blank=True, editable=False)
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None:
+            self.update_source_languages()
+        elif set(update_fields) & set(self.translatable_fields):
+            # 번역 대상 필드만 부분 저장하는 경우 감지 결과도 함께 저장
+            self.update_source_languages()
+            kwargs['update_fields'] = {*update_fields, 'source_languages'}
+        super().save(*args, **kwargs)
+
+    def update_source_languages(self):
+        """번역 대상 필드의 원문 언어 다시 감지"""
+        from .services import detect_source_language
+
+        self.source_languages = {
+            field: detect_source_language(getattr(self, field))
+            for field in self.translatable_fields
+            if getattr(self, field)
+        }
+
+
 class ContentTranslation(models.Model):
     """게시글 번역 캐시 - GenericForeignKey로 어떤 모델이든 번역 저장"""
     content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
@@ -27,3 +62,60 @@ class ContentTranslation(models.Model):
 
     def __str__(self):
         return f"{self.content_type.model}#{self.object_id}.{self.field_name} → {self.target_language}"
+
+
+class TranslationMemory(models.Model):
+    """번역 메모리 - 같은 원문(정규화 후)은 게시글이 달라도 번역 1번만 (DeepL 비용 절감)"""
+    # sha256(원문 언어, 타겟 언어, 정규화된 원문)
+    text_hash = models.CharField(max_length=64, unique=True)
+    source_language = models.CharField(max_length=5)
+    target_language = models.CharField(max_length=5)
+    source_text = models.TextField()
+    translated_text = models.TextField()
+    hit_count = models.PositiveIntegerField(default=0)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = '번역 메모리'
+        verbose_name_plural = '번역 메모리'
+
+    def __str__(self):
+        return f"{self.source_language} → {self.target_language}: {self.source_text[:30]}"
+
+
+class TranslationUsage(models.Model):
+    """일별 DeepL 사용량 (DeepL은 보낸 원문 글자 수로 과금)"""
+    date = models.DateField(unique=True)
+    characters = models.PositiveBigIntegerField(default=0)
+    requests = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name = '번역 사용량'
+        verbose_name_plural = '번역 사용량'
+        ordering = ['-date']
+
+    def __str__(self):
+        return f"{self.date}: {self.characters}자 ({self.requests}회)"
+
+
+class TranslationJob(models.Model):
+    """예산 때문에 미룬 번역 작업 (우선순위 낮은 번호부터 처리)"""
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.PositiveIntegerField()
+    field_name = models.CharField(max_length=50)
+    target_language = models.CharField(max_length=5)
+    priority = models.PositiveSmallIntegerField()
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = '번역 대기 작업'
+        verbose_name_plural = '번역 대기 작업'
+        unique_together = ['content_type', 'object_id', 'field_name', 'target_language']
+        indexes = [
+            models.Index(fields=['priority', 'created_at']),
+        ]
+
+    def __str__(self):
+        return f"[{self.priority}] {self.content_type.model}#{self.object_id}.{self.field_name} → {self.target_language}"
@@ -1,15 +1,45 @@
 """번역 핵심 서비스 - DeepL API 호출 + 번역 캐시 관리"""
+import hashlib
 import logging
-import requests
+import queue
+import threading
+import time
+import unicodedata
+
 from django.conf import settings
+from django.core import signing
+from django.core.cache import cache
+from django.template.loader import render_to_string
+from django.urls import reverse
 from django.contrib.contenttypes.models import ContentType
+from django.db.models import F, Q
+from django.utils.translation import get_language
+
+from apps.core.http import get_upstream
 
-from .models import ContentTranslation
+from . import budget, lookup_cache
+from .models import ContentTranslation, TranslationMemory
 
 logger = logging.getLogger(__name__)
 
 SUPPORTED_LANGS = ['ko', 'ja', 'en']
 
+# DeepL 요청 1번에 보낼 수 있는 최대 문장 수
+DEEPL_MAX_TEXTS = 50
+
+# 지연 번역 (TRANSLATION_MODE = 'lazy')
+LAZY_BATCH_WINDOW = 0.3       # 예약된 번역을 모으는 시간 (초)
+LAZY_PENDING_TIMEOUT = 60     # 같은 항목 중복 예약 방지 시간 (초) - 실패 시 이 시간 뒤 다시 예약 가능
+_lazy_queue = queue.Queue()
+_lazy_worker = None
+_lazy_worker_lock = threading.Lock()
+LAZY_SIGNING_SALT = 'translations.lazy'
+LAZY_POLL_DELAY = 2           # 번역 대기 중 다시 확인하는 간격 (초)
+LAZY_MAX_ATTEMPTS = 10        # 이만큼 확인해도 번역이 없으면 원문으로 확정
+
+# prefetch_translations가 객체에 붙이는 번역 맵 {(필드, 타겟 언어): 번역문 또는 None}
+PREFETCH_ATTR = '_prefetched_translations'
+
 # DeepL API 언어 코드 매핑
 DEEPL_LANG_MAP = {
     'ko': 'KO',
@@ -51,8 +81,21 @@ def detect_source_language(text):
         return 'en'
 
 
-def call_deepl_api(text, source_lang, target_lang):
-    """DeepL API 호출"""
+def get_source_language(obj, field_name):
+    """필드 원문 언어 - 저장 시 감지한 값(TranslatableModel.source_languages) 우선, 없으면 감지"""
+    source_languages = getattr(obj, 'source_languages', None)
+    if source_languages and field_name in source_languages:
+        return source_languages[field_name]
+    return detect_source_language(getattr(obj, field_name, ''))
+
+
+def call_deepl_api_batch(texts, source_lang, target_lang, allowance=None):
+    """
+    DeepL API 호출 (여러 문장을 한 요청으로)
+    - 입력과 같은 순서의 번역 목록 반환, 실패 시 None
+    - DeepL 요청당 최대 문장 수를 넘으면 나눠서 호출
+    - 글자 수 예산(allowance, 없으면 새로 만듦)을 넘으면 호출하지 않음, 보낸 글자 수는 사용량에 기록
+    """
     api_key = settings.DEEPL_API_KEY
     api_url = settings.DEEPL_API_URL
 
@@ -60,81 +103,456 @@ def call_deepl_api(text, source_lang, target_lang):
         logger.warning("DeepL API key not configured")
         return None
 
-    try:
-        response = requests.post(
-            api_url,
-            headers={
-                'Authorization': f'DeepL-Auth-Key {api_key}',
-                'Content-Type': 'application/json',
-            },
-            json={
-                'text': [text],
-                'source_lang': DEEPL_LANG_MAP.get(source_lang, source_lang.upper()),
-                'target_lang': DEEPL_LANG_MAP.get(target_lang, target_lang.upper()),
-            },
-            timeout=30,
-        )
-        response.raise_for_status()
-        result = response.json()
-        translations = result.get('translations', [])
+    if allowance is None:
+        allowance = budget.CharacterAllowance()
+
+    results = []
+    for i in range(0, len(texts), DEEPL_MAX_TEXTS):
+        chunk = texts[i:i + DEEPL_MAX_TEXTS]
+        characters = sum(len(text) for text in chunk)
+        if not allowance.take(characters):
+            return None
+
+        try:
+            response = get_upstream('deepl').post(
+                api_url,
+                headers={
+                    'Authorization': f'DeepL-Auth-Key {api_key}',
+                    'Content-Type': 'application/json',
+                },
+                json={
+                    'text': chunk,
+                    'source_lang': DEEPL_LANG_MAP.get(source_lang, source_lang.upper()),
+                    'target_lang': DEEPL_LANG_MAP.get(target_lang, target_lang.upper()),
+                },
+            )
+            response.raise_for_status()
+            translations = response.json().get('translations', [])
+        except Exception as e:
+            logger.error(f"DeepL API error: {e}")
+            return None
+
+        if len(translations) != len(chunk):
+            logger.error(f"DeepL API error: expected {len(chunk)} translations, got {len(translations)}")
+            return None
+        budget.record_usage(characters)
+        results.extend(t.get('text', '') for t in translations)
+
+    return results
+
+
+def call_deepl_api(text, source_lang, target_lang):
+    """DeepL API 호출 (문장 1개)"""
+    translations = call_deepl_api_batch([text], source_lang, target_lang)
+    if translations:
+        return translations[0]
+    return None
+
+
+def normalize_text(text):
+    """번역 메모리 키용 정규화 - 유니코드 NFC, 앞뒤 공백 제거, 줄 안의 연속 공백 1칸 (줄바꿈은 유지)"""
+    text = unicodedata.normalize('NFC', text).strip()
+    return '\n'.join(' '.join(line.split()) for line in text.splitlines())
+
+
+def memory_key(text, source_lang, target_lang):
+    """번역 메모리 키 - sha256(원문 언어, 타겟 언어, 정규화된 원문)"""
+    raw = f'{source_lang}\0{target_lang}\0{normalize_text(text)}'
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+def translate_texts(texts, source_lang, target_lang, allowance=None):
+    """
+    번역 메모리 우선 번역 - 입력과 같은 순서의 번역 목록 반환
+    (DeepL 실패/예산 초과로 번역 못 한 항목은 None, DeepL이 빈 번역을 돌려준 항목은 '')
+    - 메모리에 있는 원문은 DeepL 호출 없이 사용
+    - 나머지는 중복을 제거해 DeepL 요청 1번, 결과는 메모리에 저장
+    """
+    keys = [memory_key(text, source_lang, target_lang) for text in texts]
+    found = dict(
+        TranslationMemory.objects.filter(text_hash__in=set(keys))
+        .values_list('text_hash', 'translated_text')
+    )
+    if found:
+        TranslationMemory.objects.filter(text_hash__in=found.keys()).update(hit_count=F('hit_count') + 1)
+
+    # 메모리에 없는 원문 (같은 키는 1번만 요청)
+    missing = {}
+    for key, text in zip(keys, texts):
+        if key not in found and key not in missing:
+            missing[key] = text
+
+    if missing:
+        translations = call_deepl_api_batch(list(missing.values()), source_lang, target_lang, allowance)
         if translations:
-            return translations[0].get('text', '')
-        return None
-    except Exception as e:
-        logger.error(f"DeepL API error: {e}")
-        return None
+            entries = []
+            for (key, text), translated in zip(missing.items(), translations):
+                found[key] = translated
+                if translated:
+                    entries.append(TranslationMemory(
+                        text_hash=key,
+                        source_language=source_lang,
+                        target_language=target_lang,
+                        source_text=normalize_text(text),
+                        translated_text=translated,
+                    ))
+            # 다른 워커가 먼저 저장한 경우는 그대로 둠
+            TranslationMemory.objects.bulk_create(entries, ignore_conflicts=True)
 
+    return [found.get(key) for key in keys]
 
-def translate_on_create(obj, fields):
-    """새 게시글 작성 시 호출. 다른 2개 언어로 즉시 번역 & DB 저장."""
+
+def translate_objects(objs, fields, skip=None, allowance=None):
+    """
+    여러 게시글을 한 번에 번역 & DB 저장
+    - 필드별 원문 언어(source_languages)로 모아 (원문 언어, 타겟 언어)마다 DeepL 요청 1번
+    - 번역 메모리에 있는 원문은 DeepL 호출 없이 채움 (translate_texts)
+    - skip: 이미 번역된 (object_id, 필드, 타겟 언어) 집합 - 해당 항목은 건너뜀 (같은 모델 객체만 전달)
+    - allowance: 글자 수 예산 (budget.CharacterAllowance, 없으면 이 호출에서 1번 조회)
+    - 결과는 bulk_create 1번으로 저장 (이미 있으면 갱신)
+    - (저장한 번역 수, DeepL 실패로 번역 못 한 항목 수) 반환 (빈 번역은 실패가 아님)
+    """
     if not fields:
-        return
+        return 0, 0
+    skip = skip or set()
 
-    # 첫 번째 필드로 원문 언어 감지
-    first_text = getattr(obj, fields[0], '')
-    source_lang = detect_source_language(first_text)
-    target_langs = [l for l in SUPPORTED_LANGS if l != source_lang]
+    # (원문 언어, 타겟 언어)별 (객체, 필드, 원문) 목록
+    items_by_pair = {}
+    for obj in objs:
+        for field in fields:
+            text = getattr(obj, field, '')
+            if not text:
+                continue
+            source_lang = get_source_language(obj, field)
+            for target in SUPPORTED_LANGS:
+                if target != source_lang and (obj.pk, field, target) not in skip:
+                    items_by_pair.setdefault((source_lang, target), []).append((obj, field, text))
 
-    ct = ContentType.objects.get_for_model(obj)
+    rows, failed = _translate_items(items_by_pair, allowance)
+    return len(rows), len(failed)
+
+
+def _translate_items(items_by_pair, allowance=None):
+    """
+    {(원문 언어, 타겟 언어): [(객체, 필드, 원문), ...]} 번역 & DB 저장
+    - 언어 쌍마다 translate_texts 1번, 저장은 bulk_create 1번
+    - 글자 수 예산은 모든 언어 쌍이 함께 사용 (사용량 조회 1번)
+    - (저장한 ContentTranslation 목록, DeepL 실패로 번역 못 한 (객체, 필드, 타겟 언어) 목록) 반환
+    """
+    if allowance is None:
+        allowance = budget.CharacterAllowance()
+
+    rows = []
+    failed = []
+    for (source_lang, target), items in items_by_pair.items():
+        translations = translate_texts([text for _, _, text in items], source_lang, target, allowance)
+        for (obj, field, _text), translated in zip(items, translations):
+            if translated is None:
+                failed.append((obj, field, target))
+            elif translated:
+                rows.append(ContentTranslation(
+                    content_type=ContentType.objects.get_for_model(obj),
+                    object_id=obj.pk,
+                    field_name=field,
+                    source_language=source_lang,
+                    target_language=target,
+                    translated_text=translated,
+                ))
+
+    if rows:
+        ContentTranslation.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=['content_type', 'object_id', 'field_name', 'target_language'],
+            update_fields=['source_language', 'translated_text', 'updated_at'],
+        )
+        # bulk_create는 시그널이 없으므로 조회 캐시 직접 정리
+        lookup_cache.invalidate([
+            (row.content_type_id, row.object_id, row.field_name, row.target_language) for row in rows
+        ])
+    return rows, failed
+
+
+def translate_items(items, allowance=None):
+    """
+    (모델, pk, 필드, 타겟 언어) 단위 번역 (지연 번역, 보류 작업 처리)
+    - 처리가 끝난 항목 집합 반환: 번역 저장/빈 번역 + 더 번역할 필요 없음(객체 삭제, 빈 필드, 같은 언어)
+    - DeepL 실패 항목은 포함하지 않음
+    """
+    pks_by_model = {}
+    for model, pk, _field, _target in items:
+        pks_by_model.setdefault(model, set()).add(pk)
+    objs = {
+        (model, obj.pk): obj
+        for model, pks in pks_by_model.items()
+        if model is not None
+        for obj in model.objects.filter(pk__in=pks)
+    }
+
+    resolved = set()
+    requested = set()
+    items_by_pair = {}
+    for key in items:
+        model, pk, field, target = key
+        obj = objs.get((model, pk))
+        text = getattr(obj, field, '') if obj is not None else ''
+        source_lang = get_source_language(obj, field) if text else None
+        if not text or source_lang == target:
+            resolved.add(key)
+        else:
+            requested.add(key)
+            items_by_pair.setdefault((source_lang, target), []).append((obj, field, text))
 
+    _rows, failed = _translate_items(items_by_pair, allowance)
+    resolved |= requested - {(type(obj), obj.pk, field, target) for obj, field, target in failed}
+    return resolved
+
+
+def _translate_within_budget(obj, fields):
+    """
+    게시글 번역 - 현재 예산에서 허용되는 우선순위 항목만 바로 번역, 나머지는 보류 작업으로 저장
+    (제목/엽서 이름 → 본문 → 긴 본문 순으로 보류됨)
+    """
+    # 사용량은 1번만 조회해 우선순위 판단과 글자 수 예산에 함께 사용
+    usage = budget.get_usage() if budget.has_budget() else None
+    max_priority = budget.allowed_priority(usage)
+
+    deferred = []
     for field in fields:
         text = getattr(obj, field, '')
         if not text:
             continue
+        priority = budget.text_priority(field, text)
+        if max_priority is None or priority > max_priority:
+            source_lang = get_source_language(obj, field)
+            deferred.extend(
+                (obj, field, target, priority) for target in SUPPORTED_LANGS if target != source_lang
+            )
 
-        for target in target_langs:
-            translated = call_deepl_api(text, source_lang, target)
-            if translated:
-                ContentTranslation.objects.update_or_create(
-                    content_type=ct,
-                    object_id=obj.pk,
-                    field_name=field,
-                    target_language=target,
-                    defaults={
-                        'source_language': source_lang,
-                        'translated_text': translated,
-                    }
-                )
+    if deferred:
+        budget.enqueue_jobs(deferred)
+    translate_objects(
+        [obj], fields,
+        skip={(obj.pk, field, target) for _, field, target, _ in deferred},
+        allowance=budget.CharacterAllowance(usage),
+    )
 
 
-def get_translated_field(obj, field_name, target_lang):
-    """캐시된 번역 조회. 없으면 원문 반환."""
-    original = getattr(obj, field_name, '')
-    if not original:
-        return ''
+def is_lazy_mode():
+    """지연 번역 모드 여부 (settings.TRANSLATION_MODE = 'lazy')"""
+    return getattr(settings, 'TRANSLATION_MODE', 'eager') == 'lazy'
 
-    source_lang = detect_source_language(original)
-    if source_lang == target_lang:
-        return original
 
-    ct = ContentType.objects.get_for_model(obj)
+def translate_on_create(obj, fields):
+    """
+    새 게시글 작성 시 호출. 다른 2개 언어로 즉시 번역 & DB 저장 (메모리에 없는 원문만 언어당 API 요청 1번).
+    지연 번역 모드에서는 아무것도 하지 않음 (해당 언어로 처음 볼 때 번역)
+    """
+    if is_lazy_mode():
+        return
+    _translate_within_budget(obj, fields)
+
+
+def pending_key(model, pk, field_name, target_lang):
+    ct = ContentType.objects.get_for_model(model)
+    return f'translations:pending:{ct.pk}:{pk}:{field_name}:{target_lang}'
+
+
+def request_translation(obj, field_name, target_lang):
+    """
+    지연 번역 예약 (없는 번역을 처음 볼 때 호출)
+    - 같은 (객체, 필드, 언어)는 모든 워커를 통틀어 1번만 예약 (cache.add)
+    - 예약된 항목은 잠시 모았다가 언어 쌍별 DeepL 요청 1번으로 처리
+    """
+    if not cache.add(pending_key(type(obj), obj.pk, field_name, target_lang), 1, LAZY_PENDING_TIMEOUT):
+        return
+    _lazy_queue.put((type(obj), obj.pk, field_name, target_lang))
+    _ensure_lazy_worker()
+
+
+def _ensure_lazy_worker():
+    global _lazy_worker
+    if _lazy_worker is not None and _lazy_worker.is_alive():
+        return
+    with _lazy_worker_lock:
+        if _lazy_worker is None or not _lazy_worker.is_alive():
+            _lazy_worker = threading.Thread(target=_lazy_worker_loop, daemon=True)
+            _lazy_worker.start()
+
+
+def _lazy_worker_loop():
+    """예약된 번역을 LAZY_BATCH_WINDOW초 동안 모아 한 번에 처리"""
+    while True:
+        items = [_lazy_queue.get()]
+        time.sleep(LAZY_BATCH_WINDOW)
+        while True:
+            try:
+                items.append(_lazy_queue.get_nowait())
+            except queue.Empty:
+                break
+        _translate_pending(items)
+
+
+def _translate_pending(items):
+    """(모델, pk, 필드, 타겟 언어) 목록 번역"""
+    from django.db import close_old_connections
+
     try:
-        translation = ContentTranslation.objects.get(
+        # 처리된 항목만 예약 해제 (실패한 항목은 LAZY_PENDING_TIMEOUT 동안 다시 요청하지 않음)
+        cache.delete_many([pending_key(*key) for key in translate_items(items)])
+    except Exception as e:
+        logger.error(f"지연 번역 실패 ({len(items)}건): {e}")
+    finally:
+        close_old_connections()
+
+
+def retranslate_async(model, pk, fields):
+    """
+    백그라운드 스레드에서 게시글의 일부 필드 다시 번역 (수정된 필드)
+    - 수정 요청이 DeepL 응답을 기다리지 않도록 함
+    """
+    def _translate():
+        from django.db import close_old_connections
+
+        try:
+            obj = model.objects.filter(pk=pk).first()
+            if obj is not None:
+                _translate_within_budget(obj, fields)
+        except Exception as e:
+            logger.error(f"재번역 실패 ({model.__name__} {pk}, {fields}): {e}")
+        finally:
+            close_old_connections()
+
+    thread = threading.Thread(target=_translate, daemon=True)
+    thread.start()
+
+
+def current_language():
+    """현재 요청 언어 (2글자 코드, 없으면 ko)"""
+    return (get_language() or 'ko')[:2]
+
+
+def prefetch_translations(objs, fields, target_lang=None):
+    """
+    목록의 번역을 쿼리 1번으로 미리 불러와 각 객체에 붙임 (템플릿 필터/태그는 쿼리 없이 사용)
+    - objs: 쿼리셋 또는 객체 목록 (여러 모델이 섞여도 됨)
+    - 평가된 객체 리스트 반환 → 뷰에서 그대로 템플릿에 전달
+    """
+    objs = [obj for obj in objs if obj is not None]
+    target_lang = target_lang or current_language()
+
+    by_ct = {}
+    for obj in objs:
+        by_ct.setdefault(ContentType.objects.get_for_model(obj).pk, []).append(obj)
+    if not by_ct:
+        return objs
+
+    # 조회 캐시에 있는 번역은 DB 조회에서 제외
+    keys = [
+        (ct_id, obj.pk, field, target_lang)
+        for ct_id, group in by_ct.items() for obj in group for field in fields
+    ]
+    cached = lookup_cache.get_many(keys)
+    found = {key[:3]: text for key, text in cached.items()}
+
+    lookup = Q()
+    for ct_id, group in by_ct.items():
+        missing_ids = [
+            obj.pk for obj in group
+            if any((ct_id, obj.pk, field, target_lang) not in cached for field in fields)
+        ]
+        if missing_ids:
+            lookup |= Q(content_type_id=ct_id, object_id__in=missing_ids)
+
+    if lookup:
+        loaded = {
+            (ct_id, object_id, field_name, target_lang): text
+            for ct_id, object_id, field_name, text in ContentTranslation.objects.filter(
+                lookup, field_name__in=fields, target_language=target_lang,
+            ).values_list('content_type_id', 'object_id', 'field_name', 'translated_text')
+        }
+        # 번역이 없는 항목도 기록 (다음 조회에서 DB를 다시 보지 않도록)
+        lookup_cache.set_many({key: loaded.get(key, '') for key in keys if key not in cached})
+        found.update((key[:3], text) for key, text in loaded.items())
+
+    for ct_id, group in by_ct.items():
+        for obj in group:
+            prefetched = getattr(obj, PREFETCH_ATTR, None)
+            if prefetched is None:
+                prefetched = {}
+                setattr(obj, PREFETCH_ATTR, prefetched)
+            for field in fields:
+                # 번역이 없는 필드도 기록 (원문 사용, 다시 조회하지 않음)
+                prefetched[(field, target_lang)] = found.get((ct_id, obj.pk, field))
+    return objs
+
+
+def _find_translation(obj, field_name, target_lang):
+    """저장된 번역문 (없으면 None, prefetch_translations로 불러온 객체는 쿼리 없음)"""
+    prefetched = getattr(obj, PREFETCH_ATTR, None)
+    if prefetched is not None and (field_name, target_lang) in prefetched:
+        return prefetched[(field_name, target_lang)]
+
+    ct = ContentType.objects.get_for_model(obj)
+    key = (ct.pk, obj.pk, field_name, target_lang)
+    translated = lookup_cache.get(key)
+    if translated is None:
+        translated = ContentTranslation.objects.filter(
             content_type=ct,
             object_id=obj.pk,
             field_name=field_name,
             target_language=target_lang,
+        ).values_list('translated_text', flat=True).first()
+        lookup_cache.set_many({key: translated or ''})
+    return translated or None
+
+
+def translation_state(obj, field_name, target_lang):
+    """
+    (표시할 텍스트, 번역 대기 여부) 반환
+    - 번역이 없으면 원문 표시, 지연 번역 모드에서는 번역 예약 후 대기 상태로 표시
+    """
+    original = getattr(obj, field_name, '')
+    if not original:
+        return '', False
+
+    if get_source_language(obj, field_name) == target_lang:
+        return original, False
+
+    translated = _find_translation(obj, field_name, target_lang)
+    if translated:
+        return translated, False
+
+    if is_lazy_mode():
+        request_translation(obj, field_name, target_lang)
+        return original, True
+    # 예산 때문에 보류된 번역이면 우선 처리 대상으로
+    budget.promote_job(obj, field_name, target_lang)
+    return original, False
+
+
+def get_translated_field(obj, field_name, target_lang):
+    """캐시된 번역 조회. 없으면 원문 반환. (prefetch_translations로 불러온 객체는 쿼리 없음)"""
+    return translation_state(obj, field_name, target_lang)[0]
+
+
+def render_translated_text(obj, field_name, linebreaks=False, attempt=1):
+    """
+    번역된 필드 HTML (translations/_translated_text.html)
+    - 지연 번역 대기 중이면 원문 + '번역 중' 표시, HTMX로 주기적으로 확인해 번역문으로 교체
+    - linebreaks=True: 줄바꿈을 <p>/<br>로 변환 (|linebreaks 필터와 같음)
+    """
+    text, pending = translation_state(obj, field_name, current_language())
+    context = {
+        'text': text,
+        'linebreaks': linebreaks,
+        'pending': pending and attempt <= LAZY_MAX_ATTEMPTS,
+    }
+    if context['pending']:
+        token = signing.dumps(
+            [ContentType.objects.get_for_model(obj).pk, obj.pk, field_name, linebreaks],
+            salt=LAZY_SIGNING_SALT,
         )
-        return translation.translated_text
-    except ContentTranslation.DoesNotExist:
-        return original
+        context['poll_url'] = f"{reverse('translations:lazy', args=[token])}?attempt={attempt + 1}"
+        context['poll_delay'] = LAZY_POLL_DELAY
+    return render_to_string('translations/_translated_text.html', context)
@@ -1,46 +1,79 @@
-"""게시글 수정 시 번역 캐시 삭제"""
-from django.db.models.signals import post_save
-from django.dispatch import receiver
+"""게시글 수정 시 바뀐 필드의 번역만 삭제하고 다시 번역"""
+from django.apps import apps
 from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models.signals import post_init, post_save, post_delete
 
-from .models import ContentTranslation
+from . import lookup_cache
 
+from .models import ContentTranslation, TranslatableModel
+from .services import retranslate_async, is_lazy_mode
 
-def clear_translation_cache(sender, instance, created, **kwargs):
-    """수정 시(created=False) 기존 번역 캐시 삭제 → 다음 조회 시 원문 표시"""
-    if created:
+# 인스턴스에 보관하는 번역 대상 필드 원본 값 (수정 여부 비교용)
+SNAPSHOT_ATTR = '_translation_snapshot'
+
+
+def _take_snapshot(instance):
+    # __dict__에서 직접 읽음 - 지연 로딩(only/defer) 필드 때문에 쿼리가 나가지 않도록
+    instance.__dict__[SNAPSHOT_ATTR] = {
+        field: instance.__dict__[field]
+        for field in instance.translatable_fields
+        if field in instance.__dict__
+    }
+
+
+def snapshot_translatable_fields(sender, instance, **kwargs):
+    """DB에서 불러오거나 생성할 때 번역 대상 필드 값 기록"""
+    _take_snapshot(instance)
+
+
+def clear_translation_cache(sender, instance, created, update_fields=None, **kwargs):
+    """
+    수정 시 실제로 바뀐 번역 대상 필드의 번역만 삭제 + 재번역 예약
+    - 카운터만 저장(update_fields=['like_count'] 등)하면 아무것도 하지 않음
+    """
+    fields = instance.translatable_fields
+    if created or (update_fields is not None and not set(update_fields) & set(fields)):
+        _take_snapshot(instance)
+        return
+
+    snapshot = instance.__dict__.get(SNAPSHOT_ATTR, {})
+    changed = [
+        field for field in fields
+        if (update_fields is None or field in update_fields)
+        and (field not in snapshot or snapshot[field] != getattr(instance, field))
+    ]
+    _take_snapshot(instance)
+    if not changed:
         return
-    ct = ContentType.objects.get_for_model(instance)
+
     ContentTranslation.objects.filter(
-        content_type=ct,
+        content_type=ContentType.objects.get_for_model(instance),
         object_id=instance.pk,
+        field_name__in=changed,
     ).delete()
 
+    # 지연 번역 모드는 다음에 볼 때 번역
+    if is_lazy_mode():
+        return
+
+    # 커밋 후 백그라운드에서 바뀐 필드만 다시 번역 (그 전까지는 원문 표시)
+    model, pk = type(instance), instance.pk
+    transaction.on_commit(lambda: retranslate_async(model, pk, changed))
+
+
+def invalidate_translation_lookup(sender, instance, **kwargs):
+    """번역 저장/삭제(관리자 수정, 게시글 수정 시 삭제 등) → 조회 캐시에서 제거"""
+    lookup_cache.invalidate([
+        (instance.content_type_id, instance.object_id, instance.field_name, instance.target_language),
+    ])
+
+
+post_save.connect(invalidate_translation_lookup, sender=ContentTranslation)
+post_delete.connect(invalidate_translation_lookup, sender=ContentTranslation)
 
-# 번역 대상 모델들에 시그널 연결
-# 앱이 로드된 뒤에 import 해야 하므로 try/except
-try:
-    from apps.coordinates.models import Coordinate
-    post_save.connect(clear_translation_cache, sender=Coordinate)
-except Exception:
-    pass
-
-try:
-    from apps.comments.models import Comment
-    post_save.connect(clear_translation_cache, sender=Comment)
-except Exception:
-    pass
-
-try:
-    from apps.farming.models import FarmingJournal, FarmingRequest, FarmingParticipation
-    post_save.connect(clear_translation_cache, sender=FarmingJournal)
-    post_save.connect(clear_translation_cache, sender=FarmingRequest)
-    post_save.connect(clear_translation_cache, sender=FarmingParticipation)
-except Exception:
-    pass
-
-try:
-    from apps.core.models import Suggestion
-    post_save.connect(clear_translation_cache, sender=Suggestion)
-except Exception:
-    pass
+# 번역 대상 모델(TranslatableModel 하위 모델)들에 시그널 연결
+for model in apps.get_models():
+    if issubclass(model, TranslatableModel):
+        post_init.connect(snapshot_translatable_fields, sender=model)
+        post_save.connect(clear_translation_cache, sender=model)
@@ -1,27 +1,13 @@
 from django import template
-from django.utils.translation import get_language
 
-from apps.translations.services import get_translated_field, detect_source_language
+from apps.translations.services import get_translated_field, current_language, render_translated_text
 
 register = template.Library()
 
 
 def _get_translated(obj, field_name):
-    """공통 번역 로직"""
-    current_lang = get_language()
-    if not current_lang:
-        current_lang = 'ko'
-    current_lang = current_lang[:2]
-
-    original = getattr(obj, field_name, '')
-    if not original:
-        return ''
-
-    source_lang = detect_source_language(original)
-    if source_lang == current_lang:
-        return original
-
-    return get_translated_field(obj, field_name, current_lang)
+    """공통 번역 로직 (원문 언어 판별/번역 조회는 get_translated_field에서 1번만)"""
+    return get_translated_field(obj, field_name, current_language())
 
 
 @register.simple_tag
@@ -41,3 +27,12 @@ def translate_field(obj, field_name):
            {{ coordinate|translate_field:"description"|linebreaks }}
     """
     return _get_translated(obj, field_name)
+
+
+@register.simple_tag
+def translated_text(obj, field_name, linebreaks=False):
+    """
+    본문용 번역 HTML. 지연 번역 모드에서 번역이 아직 없으면 원문 + '번역 중' 표시 후 HTMX로 교체.
+    사용법: {% translated_text coordinate "description" linebreaks=True %}
+    """
+    return render_translated_text(obj, field_name, linebreaks=linebreaks)
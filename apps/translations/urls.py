@@ -0,0 +1,9 @@
+"""Translations app URLs - 지연 번역"""
+from django.urls import path
+from . import views
+
+app_name = 'translations'
+
+urlpatterns = [
+    path('lazy/<str:token>/', views.lazy_translation, name='lazy'),
+]
@@ -0,0 +1,35 @@
+"""지연 번역 (TRANSLATION_MODE = 'lazy') - HTMX로 번역문 교체"""
+from django.contrib.contenttypes.models import ContentType
+from django.core import signing
+from django.http import HttpResponse, HttpResponseBadRequest, Http404
+from django.views.decorators.http import require_GET
+
+from .models import TranslatableModel
+from .services import render_translated_text, LAZY_SIGNING_SALT
+
+
+@require_GET
+def lazy_translation(request, token):
+    """
+    번역 대기 중인 필드 HTML
+    - 번역이 준비됐으면 번역문, 아직이면 같은 대기 표시(다시 확인)
+    - token: 대기 표시를 렌더링할 때 서명한 (content type, pk, 필드, 줄바꿈 여부)
+    """
+    try:
+        ct_id, pk, field_name, linebreaks = signing.loads(token, salt=LAZY_SIGNING_SALT, max_age=3600)
+    except (signing.BadSignature, ValueError):
+        return HttpResponseBadRequest()
+
+    try:
+        attempt = int(request.GET.get('attempt', 1))
+    except ValueError:
+        attempt = 1
+
+    model = ContentType.objects.get_for_id(ct_id).model_class()
+    if model is None or not issubclass(model, TranslatableModel) or field_name not in model.translatable_fields:
+        raise Http404
+    obj = model.objects.filter(pk=pk).first()
+    if obj is None:
+        raise Http404
+
+    return HttpResponse(render_translated_text(obj, field_name, linebreaks=linebreaks, attempt=attempt))
@@ -66,6 +66,7 @@ MIDDLEWARE = [
     'allauth.account.middleware.AccountMiddleware',
     'django_htmx.middleware.HtmxMiddleware',
     'apps.accounts.middleware.BanCheckMiddleware',
+    'apps.accounts.middleware.BadgeResolverMiddleware',
 ]
 
 ROOT_URLCONF = 'config.urls'
@@ -111,6 +112,27 @@ DATABASES = {
 # }
 
 
+# 캐시
+# 여러 gunicorn 워커가 업로드 카운터/무효화 버전을 공유하려면 REDIS_URL 설정 필요
+# (미설정 시 프로세스 로컬 메모리 캐시 - 개발용, 운영에서는 시스템 체크 오류 core.E001)
+REDIS_URL = os.getenv('REDIS_URL', '')
+REQUIRE_SHARED_CACHE = not DEBUG
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'OPTIONS': {'MAX_ENTRIES': 10000},
+        }
+    }
+
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -158,6 +180,11 @@ MEDIA_ROOT = BASE_DIR / 'media'
 # 이미지 업로드 제한
 MAX_UPLOAD_SIZE = 5 * 1024 * 1024  # 5MB
 ALLOWED_IMAGE_TYPES = ['image/jpeg', 'image/png', 'image/webp']
+MAX_IMAGE_PIXELS = 40_000_000  # 디코딩 전 해상도 제한 (압축 폭탄 방지)
+MAX_FULL_DECODE_PIXELS = 16_000_000  # 축소 디코딩이 없는 형식(PNG, WEBP)의 해상도 제한 - 원본 해상도로 디코딩됨
+IMAGE_MAX_DIMENSION = 1920  # 저장 시 긴 변 최대 길이 (px)
+PROFILE_IMAGE_MAX_DIMENSION = 512
+IMAGE_PROCESSING_WORKERS = int(os.getenv('IMAGE_PROCESSING_WORKERS', '4'))  # 다중 이미지 병렬 처리 스레드 수
 
 
 # Default primary key field type
@@ -212,6 +239,37 @@ SOCIALACCOUNT_AUTO_SIGNUP = True
 DEEPL_API_KEY = os.getenv('DEEPL_API_KEY', '')
 DEEPL_API_URL = os.getenv('DEEPL_API_URL', 'https://api-free.deepl.com/v2/translate')
 
+# 번역 방식
+# - eager: 글 작성 시 다른 2개 언어로 바로 번역
+# - lazy: 해당 언어로 처음 볼 때 번역 (읽히지 않는 번역에 DeepL 사용량을 쓰지 않음)
+TRANSLATION_MODE = os.getenv('TRANSLATION_MODE', 'eager')
+
+# DeepL 글자 수 예산 (0이면 제한 없음) - 사용률이 오를수록 긴 본문 → 본문 → 제목 순으로 번역 보류
+TRANSLATION_DAILY_CHAR_BUDGET = int(os.getenv('TRANSLATION_DAILY_CHAR_BUDGET', '0'))
+TRANSLATION_MONTHLY_CHAR_BUDGET = int(os.getenv('TRANSLATION_MONTHLY_CHAR_BUDGET', '500000'))  # DeepL Free
+TRANSLATION_LONG_TEXT_CHARS = 500
+
+# 번역 조회 캐시 (apps/translations/lookup_cache.py) - 워커별 LRU 크기, 유효 시간(초)
+TRANSLATION_LRU_SIZE = 10000
+TRANSLATION_LRU_TTL = 60
+
+# 외부 HTTP 호출 (apps/core/http.py) - 업스트림별 타임아웃/재시도/서킷 브레이커
+# 지정하지 않은 값은 http.DEFAULT_CONFIG 사용
+OUTBOUND_HTTP = {
+    'deepl': {'timeout': (3, 10), 'retries': 2},
+    # 지역 감지는 백그라운드 작업 - Nominatim 초당 1회 제한이 있어 재시도는 1번만
+    'nominatim': {'timeout': (3, 5), 'retries': 1, 'backoff': 1.0},
+    # GeoIP 데이터베이스 다운로드 (update_geoip 명령어, 수십 MB)
+    'geoip': {'timeout': (5, 60), 'retries': 2},
+}
+
+# IP → 국가 조회 (IPLanguageMiddleware) - update_geoip 명령어로 생성/갱신
+GEOIP_DB_PATH = os.getenv('GEOIP_DB_PATH', str(BASE_DIR / 'data' / 'geoip-country.bin'))
+GEOIP_SOURCES = [
+    'https://cdn.jsdelivr.net/npm/@ip-location-db/dbip-country/dbip-country-ipv4.csv',
+    'https://cdn.jsdelivr.net/npm/@ip-location-db/dbip-country/dbip-country-ipv6.csv',
+]
+
 # 서버 기본 위치 (한국 서울)
 DEFAULT_LOCATION = {
     'latitude': 37.5665,
@@ -227,3 +285,9 @@ RANKING_SCORE = {
     'invalid_feedback': -5, # 받은 INVALID 피드백
     'farming_like': 10,    # 농사 일지 좋아요
 }
+
+# 순위 재계산 디바운스 (초) - 이 시간 안에 몰린 점수 변경은 재계산 1번으로 처리
+RANKING_RECALC_DELAY = 3
+
+# 랭킹 페이지 목록 캐시 (초) - 순위/점수 변경은 즉시, 닉네임/프로필 변경은 이 시간 후 반영
+RANKING_PAGE_CACHE_TIMEOUT = 600
@@ -45,6 +45,9 @@ urlpatterns = [
     
     # 농사 게시판
     path('farming/', include('apps.farming.urls')),
+
+    # 번역 (지연 번역 HTMX)
+    path('translations/', include('apps.translations.urls')),
     
     # 관리자 대시보드
     path(f'{ADMIN_URL}/', include('apps.admin_panel.urls')),